@@ -19,6 +19,40 @@ from python.tools.response_wrapper import wrap_tool_call
 
 logger = logging.getLogger(__name__)
 
+# Clients authenticated with the server's own credentials, keyed by
+# (client_id, base_url). Reusing them across tool calls keeps the OAuth token,
+# pooled connections and GET response cache warm; the caller's sub-account is
+# applied per request through a view that shares this state. Writes made by
+# OAuth callers go through their own per-request clients and do not clear this
+# cache, so server-credential reads may be up to cache_ttl (30s) stale after
+# such a write.
+_shared_clients: dict[tuple[str, str], JustiFiClient] = {}
+
+
+def get_shared_client(
+    config: JustiFiConfig, platform_account_id: str | None = None
+) -> JustiFiClient:
+    """Return the long-lived client for the configured credentials.
+
+    Args:
+        config: JustiFi configuration instance
+        platform_account_id: Optional default sub-account ID for this request
+
+    Returns:
+        JustiFiClient sharing the credentials' token, pool and cache
+    """
+    base_url = config.get_effective_base_url()
+    key = (config.client_id or "", base_url)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = JustiFiClient(
+            client_id=config.client_id or "",
+            client_secret=config.client_secret or "",
+            base_url=base_url,
+        )
+        _shared_clients[key] = client
+    return client.with_sub_account(platform_account_id)
+
 
 def auto_register_tools(mcp: FastMCP, config: JustiFiConfig) -> None:
     """Automatically register all available tools with MCP server.
@@ -171,7 +205,11 @@ def create_mcp_function(
     return_annotation = metadata["return_annotation"]
 
     async def mcp_tool_wrapper(*args, **kwargs) -> dict[str, Any]:
-        """Dynamically created MCP tool wrapper with per-request client."""
+        """Dynamically created MCP tool wrapper.
+
+        OAuth callers get a per-request client bound to their token; calls
+        using the server credentials share a long-lived client.
+        """
         access_token = get_access_token()
 
         # Get HTTP headers - FastMCP normalizes header names to lowercase
@@ -179,21 +217,19 @@ def create_mcp_function(
         platform_account_id = headers.get("sub-account")
 
         if access_token and access_token.token:
-            client = JustiFiClient(
+            # Close the per-request client so its connection pool is released
+            async with JustiFiClient(
                 client_id=config.client_id or "",
                 client_secret=config.client_secret or "",
                 base_url=config.get_effective_base_url(),
                 bearer_token=access_token.token,
                 platform_account_id=platform_account_id,
-            )
-        else:
-            client = JustiFiClient(
-                client_id=config.client_id or "",
-                client_secret=config.client_secret or "",
-                base_url=config.get_effective_base_url(),
-                platform_account_id=platform_account_id,
-            )
+            ) as client:
+                return await wrap_tool_call(
+                    tool_name, tool_func, client, *args, **kwargs
+                )
 
+        client = get_shared_client(config, platform_account_id)
         return await wrap_tool_call(tool_name, tool_func, client, *args, **kwargs)
 
     mcp_tool_wrapper.__signature__ = signature
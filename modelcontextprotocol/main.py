@@ -16,6 +16,8 @@ Usage:
 
     # Health check
     python main.py --health-check
+
+If uvloop is installed it is used as the asyncio event loop.
 """
 
 import asyncio
@@ -54,6 +56,21 @@ def setup_logging(log_level: str = "INFO") -> None:
     logger.info(f"Logging configured at {log_level} level")
 
 
+def install_event_loop_policy() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed.
+
+    Returns:
+        True if the uvloop policy was installed, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 async def health_check() -> dict[str, Any]:
     """Simple health check to verify FastMCP server creation and JustiFi API connectivity."""
     logger = logging.getLogger(__name__)
@@ -70,13 +87,12 @@ async def health_check() -> dict[str, Any]:
         from python.core import JustiFiClient
 
         config = JustiFiConfig()
-        client = JustiFiClient(
+        async with JustiFiClient(
             client_id=config.client_id,
             client_secret=config.client_secret,
-        )
-
-        # Try to get access token to verify API connectivity
-        token = await client.get_access_token()
+        ) as client:
+            # Try to get access token to verify API connectivity
+            token = await client.get_access_token()
 
         logger.debug("Health check completed successfully")
 
@@ -98,6 +114,9 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting JustiFi FastMCP Server initialization...")
 
+    if install_event_loop_policy():
+        logger.info("Using uvloop event loop")
+
     # Load environment variables
     load_dotenv()
 
@@ -10,15 +10,30 @@ Use with `await tool.arun(args)` or LangChain agents that support async executio
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
+
 from ..config import JustiFiConfig
 from ..core import JustiFiClient
 from ..tools.base import ToolError, ValidationError
 from .schema_generator import generate_langchain_schema
 
 
+def _dump_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON for LangChain.
+
+    Unlike json.dumps, non-ASCII text is emitted as UTF-8 rather than escaped,
+    and NaN/Infinity become null so the output is always valid JSON. Values
+    orjson can't encode natively (e.g. Decimal) fall back to str().
+    """
+    return orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 class LangChainAdapter:
     """Adapter for integrating JustiFi tools with LangChain framework."""
 
@@ -124,7 +139,7 @@ class LangChainAdapter:
             """Async LangChain tool execution."""
             try:
                 result = await self.execute_tool(tool_name, **kwargs)
-                return json.dumps(result, indent=2, default=str)
+                return _dump_result(result)
             except Exception as e:
                 return f"Error: {e}"
 
@@ -6,11 +6,38 @@ Enables secure, explicit tool selection with forward compatibility.
 
 from __future__ import annotations
 
-import inspect
+import functools
 import os
 
 from pydantic import BaseModel, Field, field_validator
 
+# Helpers exported by python.tools that are not tools themselves
+_NON_TOOL_EXPORTS = ("standardize_response", "wrap_tool_call")
+
+
+@functools.cache
+def _discover_tool_names_ordered() -> tuple[str, ...]:
+    """Auto-discover tool function names exported by the python.tools module.
+
+    Names are read from ``tools.__all__`` so discovery does not import the
+    lazily loaded tool submodules. The tools package is fixed at import
+    time, so discovery runs only once.
+
+    Returns:
+        Sorted tuple of tool names
+    """
+    from . import tools
+
+    return tuple(
+        sorted(name for name in tools.__all__ if name not in _NON_TOOL_EXPORTS)
+    )
+
+
+@functools.cache
+def _discover_tool_names() -> frozenset[str]:
+    """Auto-discovered tool names as a frozenset for O(1) membership checks."""
+    return frozenset(_discover_tool_names_ordered())
+
 
 class ContextConfig(BaseModel):
     """Global context configuration."""
@@ -146,25 +173,13 @@ class JustiFiConfig(BaseModel):
         # Allow None - validation happens at client creation time
         return v
 
-    def _discover_available_tools(self) -> set[str]:
+    def _discover_available_tools(self) -> frozenset[str]:
         """Auto-discover available tools from python.tools module.
 
         Returns:
-            Set of available tool names found in the tools module
+            Frozenset of available tool names found in the tools module
         """
-        from . import tools
-
-        discovered_tools = set()
-        for name in dir(tools):
-            if not name.startswith("_") and name not in [
-                "standardize_response",
-                "wrap_tool_call",
-            ]:
-                obj = getattr(tools, name)
-                if inspect.iscoroutinefunction(obj):
-                    discovered_tools.add(name)
-
-        return discovered_tools
+        return _discover_tool_names()
 
     @field_validator("enabled_tools")
     @classmethod
@@ -197,20 +212,20 @@ class JustiFiConfig(BaseModel):
 
         raise ValueError("enabled_tools must be a list of tool names or 'all'")
 
-    def get_available_tools(self) -> set[str]:
+    def get_available_tools(self) -> frozenset[str]:
         """Get set of all available tool names."""
         return self._discover_available_tools()
 
-    def get_enabled_tools(self) -> set[str]:
+    def get_enabled_tools(self) -> frozenset[str]:
         """Get set of enabled tool names based on configuration."""
         if self.enabled_tools == "all":
             return self.get_available_tools()
 
         if isinstance(self.enabled_tools, list):
-            return set(self.enabled_tools)
+            return frozenset(self.enabled_tools)
 
         # Fallback to empty set (no tools enabled)
-        return set()
+        return frozenset()
 
     def is_tool_enabled(self, tool_name: str) -> bool:
         """Check if a specific tool is enabled."""
@@ -7,13 +7,17 @@ for JustiFi MCP tools, with a focus on payout operations.
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import os
+import random
 import time
-from typing import Any
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, NoReturn
 
 import httpx
-from pydantic import BaseModel
+import orjson
 
 # Create logger for this module
 logger = logging.getLogger(__name__)
@@ -65,15 +69,132 @@ class RateLimitError(APIError):
     pass
 
 
-class _TokenCache(BaseModel):
+# Upper bound on a single retry delay, in seconds
+MAX_RETRY_WAIT = 30.0
+
+# Connection attempts retried by the HTTP transport before a request fails
+TRANSPORT_RETRIES = 3
+
+# Connection pool and timeouts for the shared HTTP client. Idle connections
+# are kept for a minute (httpx defaults to 5s) since agent tool calls are
+# often seconds apart and each reconnect repeats DNS and the TLS handshake.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the
+# optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+
+def _retry_wait_time(attempt: int, retry_after: str | None = None) -> float:
+    """Compute a jittered backoff delay for a retry attempt.
+
+    Uses the server's numeric Retry-After value as the base when available,
+    otherwise exponential backoff. Jitter keeps concurrent clients from
+    retrying in lockstep.
+    """
+    base: float = 2**attempt
+    if retry_after is not None:
+        try:
+            base = max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date or malformed value, keep exponential base
+
+    return min(base * random.uniform(0.5, 1.5), MAX_RETRY_WAIT)
+
+
+@dataclass(slots=True)
+class _TokenCache:
     """Simple in-memory OAuth token cache."""
 
     token: str | None = None
-    expires_at: float = 0.0  # epoch seconds
+    expires_at: float = 0.0  # time.monotonic() seconds
 
     def is_expired(self) -> bool:
         """Check if the cached token is expired."""
-        return time.time() >= self.expires_at
+        return time.monotonic() >= self.expires_at
+
+    def clear(self) -> None:
+        """Forget the cached token."""
+        self.token = None
+        self.expires_at = 0.0
+
+
+class _ResponseCache:
+    """Simple in-memory TTL cache for idempotent GET responses.
+
+    Raw response bodies are stored so every hit decodes into objects the
+    caller owns; mutating one result can't change what later readers see.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, bytes]] = {}
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the cached body for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: bytes) -> None:
+        """Cache a response body, evicting the oldest entry when full."""
+        if self.ttl <= 0:
+            return
+
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class _LoopResources:
+    """HTTP client, request slots and in-flight GETs for one event loop.
+
+    httpx connections and asyncio primitives only work on the event loop that
+    first used them, so they are rebuilt when the owning JustiFiClient is used
+    from another loop (e.g. separate asyncio.run() calls).
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.http_client: httpx.AsyncClient | None = None
+        self.request_slots = asyncio.Semaphore(max_concurrency)
+        self.inflight: dict[Hashable, asyncio.Future[bytes]] = {}
+
+    def bind(self) -> None:
+        """Attach to the running event loop, dropping state from a previous one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Not in a loop; bind on the next call made inside one
+
+        if loop is self.loop:
+            return
+        if self.loop is not None:
+            # The old loop's connections can't be closed from this loop
+            self.http_client = None
+            self.request_slots = asyncio.Semaphore(self.max_concurrency)
+            self.inflight = {}
+        self.loop = loop
 
 
 class JustiFiClient:
@@ -86,6 +207,8 @@ class JustiFiClient:
         base_url: str | None = None,
         bearer_token: str | None = None,
         platform_account_id: str | None = None,
+        cache_ttl: float = 30.0,
+        max_concurrency: int = 20,
     ):
         """Initialize the JustiFi client.
 
@@ -97,6 +220,11 @@ class JustiFiClient:
             platform_account_id: Optional default sub-account ID for API requests.
                 Used as the Sub-Account header when no sub_account_id is provided
                 to individual requests.
+            cache_ttl: Seconds to cache GET responses for repeated lookups
+                (0 disables caching). Writes clear the cache only when made
+                through this client or its with_sub_account views.
+            max_concurrency: Maximum API requests in flight at once; bursts
+                beyond this queue locally and reuse pooled connections
 
         Raises:
             AuthenticationError: If credentials are invalid
@@ -119,14 +247,69 @@ class JustiFiClient:
         # Normalize URL - remove trailing slashes and warn about /v1 suffix
         self.base_url = self.base_url.rstrip("/")
         if self.base_url.endswith("/v1"):
-            logger.warning(f"Base URL should not include /v1 suffix: {self.base_url}")
+            logger.warning("Base URL should not include /v1 suffix: %s", self.base_url)
             self.base_url = self.base_url[:-3]
 
         self._token_cache = _TokenCache()
+        self._get_cache = _ResponseCache(ttl=cache_ttl)
+        # Shared HTTP client, created lazily inside the running event loop so
+        # OAuth and API calls reuse the same pooled connections
+        self._loop_resources = _LoopResources(max_concurrency)
 
-        logger.debug(f"JustiFi client initialized with base URL: {self.base_url}")
+        logger.debug("JustiFi client initialized with base URL: %s", self.base_url)
         if platform_account_id:
-            logger.debug(f"Default platform account ID: {platform_account_id}")
+            logger.debug("Default platform account ID: %s", platform_account_id)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use in a loop."""
+        resources = self._loop_resources
+        resources.bind()
+        if resources.http_client is None or resources.http_client.is_closed:
+            # Pool limits belong on the transport; the client ignores its own
+            # limits when a custom transport is supplied
+            resources.http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=TRANSPORT_RETRIES,
+                    limits=HTTP_LIMITS,
+                    http2=HTTP2_AVAILABLE,
+                ),
+            )
+        return resources.http_client
+
+    def with_sub_account(self, sub_account_id: str | None) -> JustiFiClient:
+        """Return a client defaulting to another sub-account.
+
+        The returned client shares this client's OAuth token, connection pool,
+        GET response cache and concurrency limit; only the default Sub-Account
+        header differs. Cache entries stay separate because the Sub-Account
+        header is part of the cache key.
+
+        Args:
+            sub_account_id: Default sub-account ID for the returned client
+
+        Returns:
+            This client if the sub-account is unchanged, otherwise a view of it
+        """
+        if sub_account_id == self.platform_account_id:
+            return self
+        view = copy.copy(self)
+        view.platform_account_id = sub_account_id
+        return view
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        resources = self._loop_resources
+        resources.bind()  # A client left over from another loop is just dropped
+        if resources.http_client is not None:
+            await resources.http_client.aclose()
+            resources.http_client = None
+
+    async def __aenter__(self) -> JustiFiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if necessary.
@@ -148,45 +331,45 @@ class JustiFiClient:
         logger.debug("Requesting new access token from JustiFi OAuth endpoint")
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                oauth_url = f"{self.base_url}/oauth/token"
-                logger.debug(f"Making OAuth request to: {oauth_url}")
-
-                response = await client.post(
-                    oauth_url,
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+            oauth_url = f"{self.base_url}/oauth/token"
+            logger.debug("Making OAuth request to: %s", oauth_url)
+
+            response = await self._get_http_client().post(
+                oauth_url,
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
 
-                if response.status_code == 401:
-                    logger.error("OAuth authentication failed - invalid credentials")
-                    raise AuthenticationError(
-                        "Invalid JustiFi credentials. Please check your JUSTIFI_CLIENT_ID and JUSTIFI_CLIENT_SECRET.",
-                        error_code="invalid_credentials",
-                    )
+            if response.status_code == 401:
+                logger.error("OAuth authentication failed - invalid credentials")
+                raise AuthenticationError(
+                    "Invalid JustiFi credentials. Please check your JUSTIFI_CLIENT_ID and JUSTIFI_CLIENT_SECRET.",
+                    error_code="invalid_credentials",
+                )
 
-                response.raise_for_status()
-                token_data = response.json()
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
 
             # Cache the token with expiration
             expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
             access_token: str = token_data["access_token"]
-            self._token_cache = _TokenCache(
-                token=access_token,
-                expires_at=time.time() + expires_in - 60,  # Refresh 1 minute early
-            )
+            self._get_cache.clear()
+            # Updated in place so sub-account views share the token
+            self._token_cache.token = access_token
+            # Refresh 1 minute early
+            self._token_cache.expires_at = time.monotonic() + expires_in - 60
 
             logger.debug(
-                f"Successfully obtained access token (expires in {expires_in}s)"
+                "Successfully obtained access token (expires in %ss)", expires_in
             )
             return access_token
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error during OAuth: {e.response.status_code}")
+            logger.error("HTTP error during OAuth: %s", e.response.status_code)
             if e.response.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Please verify your JustiFi credentials.",
@@ -198,7 +381,7 @@ class JustiFiClient:
                     error_code="auth_error",
                 ) from e
         except httpx.RequestError as e:
-            logger.error(f"Network error during OAuth: {e}")
+            logger.error("Network error during OAuth: %s", e)
             raise AuthenticationError(
                 "Unable to connect to JustiFi API. Please check your network connection.",
                 error_code="connection_error",
@@ -214,6 +397,7 @@ class JustiFiClient:
         extra_headers: dict[str, str] | None = None,
         retries: int = 3,
         sub_account_id: str | None = None,
+        cache: bool = True,
     ) -> dict[str, Any]:
         """Make an authenticated request to the JustiFi API with retry logic.
 
@@ -224,10 +408,14 @@ class JustiFiClient:
             data: Request body data
             idempotency_key: Optional idempotency key
             extra_headers: Additional headers to include in the request
-            retries: Number of retry attempts for transient errors
+            retries: Number of retry attempts for 429 and 5xx responses, and
+                for network errors on GETs. Failed connects are also retried by
+                the HTTP transport.
             sub_account_id: Optional sub-account ID for this request. If provided,
                 sets the Sub-Account header. Falls back to platform_account_id if
                 not provided.
+            cache: Whether a GET may be served from, and stored in, the response
+                cache. Pass False for status polling that must see live state.
 
         Returns:
             API response data
@@ -245,74 +433,150 @@ class JustiFiClient:
                 extra_headers["Sub-Account"] = effective_sub_account
                 if sub_account_id:
                     logger.debug(
-                        f"Using request-specific sub-account: {sub_account_id}"
+                        "Using request-specific sub-account: %s", sub_account_id
                     )
                 elif self.platform_account_id:
                     logger.debug(
-                        f"Using platform default sub-account: {self.platform_account_id}"
+                        "Using platform default sub-account: %s",
+                        self.platform_account_id,
                     )
 
         url = f"{self.base_url}{endpoint}"
-        logger.debug(f"Making {method} request to: {url}")
+        logger.debug("Making %s request to: %s", method, url)
 
         if params:
-            logger.debug(f"Query parameters: {params}")
-        if data:
-            logger.debug(f"Request body keys: {list(data.keys()) if data else 'None'}")
-
-        for attempt in range(retries + 1):
-            try:
-                return await self._make_request(
-                    method, url, params, data, idempotency_key, extra_headers
+            logger.debug("Query parameters: %s", params)
+        if data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body keys: %s", list(data.keys()))
+
+        cache_key = None
+        if method.upper() == "GET" and not idempotency_key and cache:
+            cache_key = self._get_cache_key(endpoint, params, extra_headers)
+            cached = self._get_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                logger.debug("Using cached response for: %s", url)
+                return self._decode_response(cached)
+        elif method.upper() != "GET":
+            # Writes may change any previously cached resource
+            self._get_cache.clear()
+
+        if cache_key is None:
+            return self._decode_response(
+                await self._send(
+                    method, url, params, data, idempotency_key, extra_headers, retries
                 )
+            )
 
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    f"HTTP error on attempt {attempt + 1}: {e.response.status_code}"
+        # Coalesce concurrent identical GETs onto a single in-flight request.
+        # Waiters are shielded so one caller being cancelled doesn't cancel
+        # the shared request for the others. Each waiter decodes the shared
+        # body itself so no two callers receive the same objects.
+        resources = self._loop_resources
+        resources.bind()
+        inflight = resources.inflight
+        task = inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send(
+                    method,
+                    url,
+                    params,
+                    data,
+                    idempotency_key,
+                    extra_headers,
+                    retries,
+                    cache_key,
                 )
+            )
+            inflight[cache_key] = task
+            task.add_done_callback(lambda _: inflight.pop(cache_key, None))
+        else:
+            logger.debug("Joining in-flight request for: %s", url)
+        return self._decode_response(await asyncio.shield(task))
 
-                # Don't retry client errors (4xx) except 429
-                if (
-                    400 <= e.response.status_code < 500
-                    and e.response.status_code != 429
-                ):
-                    await self._handle_client_error(e)
-                    return {}  # This line won't be reached due to exception, but satisfies linter
-
-                # Retry on server errors (5xx) and rate limits (429)
-                if attempt < retries and (
-                    e.response.status_code >= 500 or e.response.status_code == 429
-                ):
-                    wait_time = min(2**attempt, 10)  # Exponential backoff, max 10s
-                    logger.info(
-                        f"Retrying in {wait_time}s (attempt {attempt + 1}/{retries})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
+    @staticmethod
+    def _decode_response(body: bytes) -> dict[str, Any]:
+        """Decode a response body into a new object tree for the caller."""
+        result: dict[str, Any] = orjson.loads(body)
+        logger.debug("Response received with %d top-level keys", len(result))
+        return result
 
-                # Final attempt failed
-                await self._handle_server_error(e)
-                return {}  # This line won't be reached due to exception, but satisfies linter
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        idempotency_key: str | None,
+        extra_headers: dict[str, str] | None,
+        retries: int,
+        cache_key: Hashable | None = None,
+    ) -> bytes:
+        """Send a request, retrying 429/5xx and GET network errors, and cache GETs.
 
+        Returns the raw body of the successful response.
+        """
+        resources = self._loop_resources
+        resources.bind()
+        for attempt in range(retries + 1):
+            try:
+                async with resources.request_slots:
+                    resp = await self._make_request(
+                        method, url, params, data, idempotency_key, extra_headers
+                    )
             except httpx.RequestError as e:
-                logger.warning(f"Network error on attempt {attempt + 1}: {e}")
-
-                # Retry on network errors
-                if attempt < retries:
-                    wait_time = min(2**attempt, 10)
-                    logger.info(
-                        f"Retrying in {wait_time}s (attempt {attempt + 1}/{retries})"
+                # The transport only retries failed connects; read timeouts and
+                # dropped keep-alive connections are retried here, but only for
+                # GETs since a write may already have been applied
+                if attempt < retries and method.upper() == "GET":
+                    wait_time = _retry_wait_time(attempt)
+                    logger.warning(
+                        "Network error on attempt %d: %s; retrying in %.2fs",
+                        attempt + 1,
+                        e,
+                        wait_time,
                     )
                     await asyncio.sleep(wait_time)
                     continue
 
-                logger.error("Max retry attempts exceeded for network error")
+                logger.error("Network error: %s", e)
                 raise APIError(
                     "Unable to connect to JustiFi API. Please check your network connection and try again.",
                     status_code=0,
                     error_code="connection_error",
                 ) from e
 
+            status_code = resp.status_code
+            if resp.is_success:
+                body = resp.content
+                if cache_key:
+                    self._get_cache.set(cache_key, body)
+                return body
+
+            logger.warning("HTTP error on attempt %d: %s", attempt + 1, status_code)
+
+            # Don't retry client errors (4xx) except 429
+            if 400 <= status_code < 500 and status_code != 429:
+                self._handle_client_error(resp)
+
+            # Retry on server errors (5xx) and rate limits (429)
+            if attempt < retries and (status_code >= 500 or status_code == 429):
+                retry_after = None
+                if status_code in (429, 503):
+                    retry_after = resp.headers.get("Retry-After")
+                wait_time = _retry_wait_time(attempt, retry_after)
+                logger.info(
+                    "Retrying in %.2fs (attempt %d/%d)",
+                    wait_time,
+                    attempt + 1,
+                    retries,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            # Final attempt failed
+            self._handle_server_error(resp)
+
         # This should never be reached, but satisfies linter
         raise APIError(
             "Maximum retry attempts exceeded",
@@ -320,14 +584,35 @@ class JustiFiClient:
             error_code="max_retries_exceeded",
         )
 
-    async def _handle_client_error(self, error: httpx.HTTPStatusError) -> None:
-        """Handle 4xx client errors - pass through JustiFi errors."""
+    @staticmethod
+    def _get_cache_key(
+        endpoint: str,
+        params: dict[str, Any] | None,
+        extra_headers: dict[str, str] | None,
+    ) -> Hashable | None:
+        """Build a cache key for a GET request, or None if it can't be cached."""
+        key = (
+            endpoint,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((extra_headers or {}).items())),
+        )
         try:
-            error_data = error.response.json()
-        except Exception:
+            hash(key)
+        except TypeError:
+            return None  # Unhashable parameter values
+        return key
+
+    @staticmethod
+    def _parse_error_response(
+        response: httpx.Response,
+    ) -> tuple[int, str, str, Any]:
+        """Extract status, code, message and payload from a JustiFi error response."""
+        try:
+            error_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             error_data = {}
 
-        status_code = error.response.status_code
+        status_code = response.status_code
 
         # Extract error info from JustiFi response (nested under "error" key)
         justifi_error = (
@@ -337,62 +622,48 @@ class JustiFiClient:
         )
         if isinstance(justifi_error, dict):
             error_code = justifi_error.get("code", f"http_{status_code}")
-            error_message = justifi_error.get("message", error.response.text)
+            error_message = justifi_error.get("message", response.text)
         else:
             error_code = f"http_{status_code}"
-            error_message = str(justifi_error) if justifi_error else error.response.text
-
-        logger.error(f"JustiFi API error {status_code}: {error_code} - {error_message}")
-
-        if status_code == 401:
-            logger.warning("Authentication failed - clearing token cache")
-            self._token_cache = _TokenCache()
-            raise AuthenticationError(
-                error_message, error_code=error_code, details=error_data
-            )
-        elif status_code == 429:
-            raise RateLimitError(
-                error_message,
-                status_code=429,
-                error_code=error_code,
-                details=error_data,
-            )
-        elif status_code in (400, 404, 422):
-            raise ValidationError(
-                error_message, error_code=error_code, details=error_data
-            )
-        else:
-            raise APIError(
-                error_message,
-                status_code=status_code,
-                error_code=error_code,
-                details=error_data,
-            )
-
-    async def _handle_server_error(self, error: httpx.HTTPStatusError) -> None:
-        """Handle 5xx server errors - pass through JustiFi errors."""
-        try:
-            error_data = error.response.json()
-        except Exception:
-            error_data = {}
+            error_message = str(justifi_error) if justifi_error else response.text
 
-        status_code = error.response.status_code
+        logger.error(
+            "JustiFi API error %s: %s - %s", status_code, error_code, error_message
+        )
+        return status_code, error_code, error_message, error_data
+
+    def _raise_authentication_error(
+        self, status_code: int, error_code: str, error_message: str, error_data: Any
+    ) -> NoReturn:
+        """Clear cached credentials and raise AuthenticationError (401)."""
+        logger.warning("Authentication failed - clearing token cache")
+        self._token_cache.clear()
+        self._get_cache.clear()
+        raise AuthenticationError(
+            error_message, error_code=error_code, details=error_data
+        )
 
-        # Extract error info from JustiFi response
-        justifi_error = (
-            error_data.get("error", error_data)
-            if isinstance(error_data, dict)
-            else error_data
+    def _raise_rate_limit_error(
+        self, status_code: int, error_code: str, error_message: str, error_data: Any
+    ) -> NoReturn:
+        """Raise RateLimitError (429)."""
+        raise RateLimitError(
+            error_message,
+            status_code=status_code,
+            error_code=error_code,
+            details=error_data,
         )
-        if isinstance(justifi_error, dict):
-            error_code = justifi_error.get("code", f"http_{status_code}")
-            error_message = justifi_error.get("message", error.response.text)
-        else:
-            error_code = f"http_{status_code}"
-            error_message = str(justifi_error) if justifi_error else error.response.text
 
-        logger.error(f"JustiFi API error {status_code}: {error_code} - {error_message}")
+    def _raise_validation_error(
+        self, status_code: int, error_code: str, error_message: str, error_data: Any
+    ) -> NoReturn:
+        """Raise ValidationError (400, 404, 422)."""
+        raise ValidationError(error_message, error_code=error_code, details=error_data)
 
+    def _raise_api_error(
+        self, status_code: int, error_code: str, error_message: str, error_data: Any
+    ) -> NoReturn:
+        """Raise a generic APIError."""
         raise APIError(
             error_message,
             status_code=status_code,
@@ -400,6 +671,27 @@ class JustiFiClient:
             details=error_data,
         )
 
+    # 4xx status codes with a dedicated exception type; others raise APIError
+    _CLIENT_ERROR_HANDLERS: dict[int, Callable[..., NoReturn]] = {
+        400: _raise_validation_error,
+        401: _raise_authentication_error,
+        404: _raise_validation_error,
+        422: _raise_validation_error,
+        429: _raise_rate_limit_error,
+    }
+
+    def _handle_client_error(self, response: httpx.Response) -> NoReturn:
+        """Handle 4xx client errors - pass through JustiFi errors."""
+        status_code, *details = self._parse_error_response(response)
+        handler = self._CLIENT_ERROR_HANDLERS.get(
+            status_code, JustiFiClient._raise_api_error
+        )
+        handler(self, status_code, *details)
+
+    def _handle_server_error(self, response: httpx.Response) -> NoReturn:
+        """Handle 5xx server errors - pass through JustiFi errors."""
+        self._raise_api_error(*self._parse_error_response(response))
+
     async def _make_request(
         self,
         method: str,
@@ -408,8 +700,11 @@ class JustiFiClient:
         data: dict[str, Any] | None,
         idempotency_key: str | None,
         extra_headers: dict[str, str] | None,
-    ) -> dict[str, Any]:
-        """Make the actual HTTP request with current token."""
+    ) -> httpx.Response:
+        """Make the actual HTTP request with current token.
+
+        The response body is fully read; status handling is left to the caller.
+        """
         token = await self.get_access_token()
         headers = {
             "Authorization": f"Bearer {token}",
@@ -420,13 +715,19 @@ class JustiFiClient:
         if extra_headers:
             headers.update(extra_headers)
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.request(
-                method.upper(), url, headers=headers, params=params, json=data
-            )
-
-            logger.debug(f"Response status: {resp.status_code}")
-            resp.raise_for_status()
-            result: dict[str, Any] = resp.json()
-            logger.debug(f"Response received with {len(result)} top-level keys")
-            return result
+        # GETs carry no body; anything else is serialized once with orjson
+        # rather than going through httpx's json= encoding path
+        content: bytes | None = None
+        if data is not None:
+            content = orjson.dumps(data)
+            headers.setdefault("Content-Type", "application/json")
+
+        async with self._get_http_client().stream(
+            method.upper(), url, headers=headers, params=params, content=content
+        ) as resp:
+            # Read the raw body so it is decoded straight from bytes and the
+            # connection goes back to the pool as soon as the block exits
+            await resp.aread()
+
+        logger.debug("Response status: %s", resp.status_code)
+        return resp
@@ -11,7 +11,8 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from .adapters.langchain import LangChainAdapter
 
-from .config import JustiFiConfig
+from . import tools as _tools
+from .config import JustiFiConfig, _discover_tool_names_ordered
 
 
 class JustiFiToolkit:
@@ -72,6 +73,17 @@ class JustiFiToolkit:
 
         # Initialize adapters as None for lazy loading
         self._langchain_adapter: LangChainAdapter | None = None
+        self._enabled_tools_cache: tuple[frozenset[str], dict[str, Any]] | None = None
+
+    @property
+    def _enabled_tools(self) -> dict[str, Any]:
+        # Keyed on the enabled names so replacing or editing the config is
+        # picked up; attribute access imports only the enabled tool modules
+        names = self.config.get_enabled_tools()
+        if self._enabled_tools_cache is None or self._enabled_tools_cache[0] != names:
+            tools = {name: getattr(_tools, name) for name in names}
+            self._enabled_tools_cache = (names, tools)
+        return self._enabled_tools_cache[1]
 
     def get_enabled_tools(self) -> dict[str, Any]:
         """Get currently enabled tools based on configuration.
@@ -79,26 +91,11 @@ class JustiFiToolkit:
         Returns:
             Dictionary mapping tool names to tool functions
         """
-        enabled_tools = {}
-        enabled_tool_names = self.config.get_enabled_tools()
-
-        # Import tools dynamically to avoid circular imports
-        from . import tools
-
-        # Get all available tools from config auto-discovery
-        available_tools = self.config.get_available_tools()
-
-        for tool_name in enabled_tool_names:
-            if tool_name in available_tools:
-                tool_func = getattr(tools, tool_name, None)
-                if tool_func:
-                    enabled_tools[tool_name] = tool_func
-
-        return enabled_tools
+        return dict(self._enabled_tools)
 
     def get_configuration_summary(self) -> dict[str, Any]:
         """Get a summary of the current configuration."""
-        enabled_tools = self.get_enabled_tools()
+        enabled_tools = self._enabled_tools
 
         return {
             "environment": self.config.context.environment,
@@ -107,7 +104,7 @@ class JustiFiToolkit:
             "rate_limit": self.config.context.rate_limit,
             "enabled_tools": list(enabled_tools.keys()),
             "total_tools": len(enabled_tools),
-            "available_tools": list(self.config.get_available_tools()),
+            "available_tools": list(_discover_tool_names_ordered()),
         }
 
     # Framework-specific methods
@@ -1,77 +1,70 @@
-"""JustiFi Tools Package - Core tool implementations."""
+"""JustiFi Tools Package - Core tool implementations.
 
-# Import all tools for direct usage
-from .balances import list_balance_transactions, retrieve_balance_transaction
-from .checkouts import list_checkouts, retrieve_checkout
-from .code_generators import generate_unified_checkout_integration
-from .disputes import list_disputes, retrieve_dispute
-from .payment_method_groups import (
-    create_payment_method_group,
-    list_payment_method_groups,
-    remove_payment_method_from_group,
-    retrieve_payment_method_group,
-    update_payment_method_group,
-)
-from .payment_methods import retrieve_payment_method
-from .payments import list_payments, retrieve_payment
-from .payouts import (
-    get_payout_status,
-    get_recent_payouts,
-    list_payouts,
-    retrieve_payout,
-)
-from .proceeds import list_proceeds, retrieve_proceed
-from .refunds import list_payment_refunds, list_refunds, retrieve_refund
-from .response_formatter import standardize_response
-from .response_wrapper import wrap_tool_call
-from .sub_accounts import (
-    get_sub_account,
-    get_sub_account_payout_account,
-    get_sub_account_settings,
-    list_sub_accounts,
-)
-from .terminals import (
-    get_terminal_status,
-    identify_terminal,
-    list_terminals,
-    retrieve_terminal,
-    update_terminal,
-)
+Tool functions are imported lazily (PEP 562): each submodule is loaded the
+first time one of its names is accessed, so deployments that enable only a
+few tools never import the rest.
+"""
 
-__all__ = [
-    "create_payment_method_group",
-    "generate_unified_checkout_integration",
-    "list_balance_transactions",
-    "list_payment_method_groups",
-    "remove_payment_method_from_group",
-    "retrieve_balance_transaction",
-    "retrieve_payment_method_group",
-    "update_payment_method_group",
-    "list_checkouts",
-    "retrieve_checkout",
-    "list_disputes",
-    "retrieve_dispute",
-    "retrieve_payment_method",
-    "list_payments",
-    "retrieve_payment",
-    "get_payout_status",
-    "get_recent_payouts",
-    "list_payouts",
-    "retrieve_payout",
-    "list_payment_refunds",
-    "list_proceeds",
-    "list_refunds",
-    "retrieve_proceed",
-    "retrieve_refund",
-    "get_sub_account",
-    "get_sub_account_payout_account",
-    "get_sub_account_settings",
-    "list_sub_accounts",
-    "get_terminal_status",
-    "identify_terminal",
-    "list_terminals",
-    "retrieve_terminal",
-    "update_terminal",
-    "standardize_response",
-    "wrap_tool_call",
-]
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS: dict[str, str] = {
+    "list_balance_transactions": "balances",
+    "retrieve_balance_transaction": "balances",
+    "list_checkouts": "checkouts",
+    "retrieve_checkout": "checkouts",
+    "retrieve_checkouts": "checkouts",
+    "generate_unified_checkout_integration": "code_generators",
+    "list_disputes": "disputes",
+    "retrieve_dispute": "disputes",
+    "create_payment_method_group": "payment_method_groups",
+    "list_payment_method_groups": "payment_method_groups",
+    "remove_payment_method_from_group": "payment_method_groups",
+    "retrieve_payment_method_group": "payment_method_groups",
+    "update_payment_method_group": "payment_method_groups",
+    "retrieve_payment_method": "payment_methods",
+    "list_payments": "payments",
+    "retrieve_payment": "payments",
+    "get_payout_status": "payouts",
+    "get_recent_payouts": "payouts",
+    "list_payouts": "payouts",
+    "retrieve_payout": "payouts",
+    "list_proceeds": "proceeds",
+    "retrieve_proceed": "proceeds",
+    "list_payment_refunds": "refunds",
+    "list_refunds": "refunds",
+    "retrieve_refund": "refunds",
+    "standardize_response": "response_formatter",
+    "wrap_tool_call": "response_wrapper",
+    "get_sub_account": "sub_accounts",
+    "get_sub_account_payout_account": "sub_accounts",
+    "get_sub_account_settings": "sub_accounts",
+    "list_sub_accounts": "sub_accounts",
+    "get_terminal_status": "terminals",
+    "identify_terminal": "terminals",
+    "list_terminals": "terminals",
+    "retrieve_terminal": "terminals",
+    "update_terminal": "terminals",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
+
+
+# Derived from the lazy map so the two can never drift apart
+__all__ = list(_LAZY_EXPORTS)
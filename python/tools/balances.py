@@ -7,7 +7,7 @@ Tools for retrieving balance transaction information.
 from typing import Any
 
 from ..core import JustiFiClient
-from .base import ValidationError, handle_tool_errors
+from .base import RESOURCE_ID_PATTERN, ValidationError, handle_tool_errors
 
 
 @handle_tool_errors
@@ -57,7 +57,7 @@ async def list_balance_transactions(
         ToolError: For API errors
     """
     # Validation
-    if limit < 1 or limit > 100:
+    if type(limit) is not int or not 1 <= limit <= 100:
         raise ValidationError(
             "limit must be an integer between 1 and 100", field="limit", value=limit
         )
@@ -65,13 +65,16 @@ async def list_balance_transactions(
     if after_cursor and before_cursor:
         raise ValidationError("Cannot specify both after_cursor and before_cursor")
 
-    params: dict[str, Any] = {"limit": limit}
-    if after_cursor:
-        params["after_cursor"] = after_cursor
-    if before_cursor:
-        params["before_cursor"] = before_cursor
-    if payout_id:
-        params["payout_id"] = payout_id
+    params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("limit", limit),
+            ("after_cursor", after_cursor),
+            ("before_cursor", before_cursor),
+            ("payout_id", payout_id),
+        )
+        if value
+    }
 
     response = await client.request(
         "GET", "/v1/balance_transactions", params=params, sub_account_id=sub_account_id
@@ -125,9 +128,18 @@ async def retrieve_balance_transaction(
     if not balance_transaction_id:
         raise ValidationError("balance_transaction_id must be a non-empty string")
 
-    if isinstance(balance_transaction_id, str) and not balance_transaction_id.strip():
+    if not isinstance(balance_transaction_id, str):
+        raise ValidationError("balance_transaction_id must be a non-empty string")
+
+    if not RESOURCE_ID_PATTERN.match(balance_transaction_id):
+        if balance_transaction_id.isspace():
+            raise ValidationError(
+                "balance_transaction_id cannot be empty or contain only whitespace"
+            )
         raise ValidationError(
-            "balance_transaction_id cannot be empty or contain only whitespace"
+            "balance_transaction_id contains invalid characters",
+            field="balance_transaction_id",
+            value=balance_transaction_id,
         )
 
     response = await client.request(
@@ -6,11 +6,16 @@ error handling, validation, and interface patterns.
 """
 
 import functools
+import re
 from abc import ABC, abstractmethod
 from typing import Any
 
 from ..core import JustiFiClient
 
+# JustiFi resource IDs (e.g. 'co_ABC123') are URL-safe tokens; anything else
+# would be rejected by the API or change the request path
+RESOURCE_ID_PATTERN = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+
 
 class ToolError(Exception):
     """Base exception for tool errors."""
@@ -100,8 +105,8 @@ def handle_tool_errors(func: Any) -> Any:
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
         try:
             return await func(*args, **kwargs)
-        except ValidationError:
-            # Re-raise validation errors as-is
+        except ToolError:
+            # Validation and other tool errors are already formatted
             raise
         except Exception as e:
             # Wrap other exceptions in ToolError
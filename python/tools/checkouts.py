@@ -8,10 +8,18 @@ structures and can be used by any framework adapter.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from ..core import JustiFiClient
-from .base import ValidationError, handle_tool_errors
+from .base import (
+    RESOURCE_ID_PATTERN,
+    ValidationError,
+    handle_tool_errors,
+)
+
+_PAYMENT_MODES = frozenset(("bnpl", "ecom"))
+_CHECKOUT_STATUSES = frozenset(("created", "completed", "attempted", "expired"))
 
 
 @handle_tool_errors
@@ -67,7 +75,7 @@ async def list_checkouts(
         ToolError: For API errors (wrapped from httpx.HTTPStatusError).
     """
     # Validation
-    if limit < 1 or limit > 100:
+    if type(limit) is not int or not 1 <= limit <= 100:
         raise ValidationError(
             "limit must be between 1 and 100", field="limit", value=limit
         )
@@ -76,7 +84,7 @@ async def list_checkouts(
         raise ValidationError("Cannot specify both after_cursor and before_cursor")
 
     # Validate payment_mode if provided
-    if payment_mode and payment_mode not in ["bnpl", "ecom"]:
+    if payment_mode and payment_mode not in _PAYMENT_MODES:
         raise ValidationError(
             "payment_mode must be 'bnpl' or 'ecom'",
             field="payment_mode",
@@ -84,24 +92,25 @@ async def list_checkouts(
         )
 
     # Validate status if provided
-    if status and status not in ["created", "completed", "attempted", "expired"]:
+    if status and status not in _CHECKOUT_STATUSES:
         raise ValidationError(
             "status must be one of: created, completed, attempted, expired",
             field="status",
             value=status,
         )
 
-    params: dict[str, Any] = {"limit": limit}
-    if after_cursor:
-        params["after_cursor"] = after_cursor
-    if before_cursor:
-        params["before_cursor"] = before_cursor
-    if payment_mode:
-        params["payment_mode"] = payment_mode
-    if status:
-        params["status"] = status
-    if payment_status:
-        params["payment_status"] = payment_status
+    params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("limit", limit),
+            ("after_cursor", after_cursor),
+            ("before_cursor", before_cursor),
+            ("payment_mode", payment_mode),
+            ("status", status),
+            ("payment_status", payment_status),
+        )
+        if value
+    }
 
     return await client.request(
         "GET", "/v1/checkouts", params=params, sub_account_id=sub_account_id
@@ -150,11 +159,70 @@ async def retrieve_checkout(
         ValidationError: If checkout_id is empty or invalid.
         ToolError: For API errors (wrapped from httpx.HTTPStatusError).
     """
-    if not checkout_id or not checkout_id.strip():
+    if not isinstance(checkout_id, str) or not RESOURCE_ID_PATTERN.match(checkout_id):
         raise ValidationError(
-            "checkout_id cannot be empty", field="checkout_id", value=checkout_id
+            "checkout_id cannot be empty or contain invalid characters",
+            field="checkout_id",
+            value=checkout_id,
         )
 
     return await client.request(
         "GET", f"/v1/checkouts/{checkout_id}", sub_account_id=sub_account_id
     )
+
+
+@handle_tool_errors
+async def retrieve_checkouts(
+    client: JustiFiClient,
+    checkout_ids: list[str],
+    sub_account_id: str | None = None,
+) -> dict[str, Any]:
+    """Retrieve several checkout sessions by ID in a single call.
+
+    Use this instead of calling `retrieve_checkout` repeatedly when you already
+    have a set of checkout IDs, e.g. from `list_checkouts` or webhooks. Lookups
+    run concurrently, bounded by the client's max_concurrency.
+
+    Related tools:
+    - Use `retrieve_checkout` for a single checkout
+    - Use `list_checkouts` to find checkout IDs
+
+    Args:
+        client: JustiFi client instance.
+        checkout_ids: Checkout IDs to retrieve (1-100), e.g. ['co_ABC123', 'co_DEF456'].
+        sub_account_id: Optional sub-account ID. Overrides the default
+            platform_account_id if provided.
+
+    Returns:
+        Object containing:
+        - data: Array of checkout objects, in the same order as checkout_ids
+
+    Raises:
+        ValidationError: If checkout_ids is empty, too long, or has an invalid ID.
+        ToolError: For API errors (wrapped from httpx.HTTPStatusError).
+    """
+    if not isinstance(checkout_ids, list) or not 1 <= len(checkout_ids) <= 100:
+        raise ValidationError(
+            "checkout_ids must be a list of 1 to 100 checkout IDs",
+            field="checkout_ids",
+            value=checkout_ids,
+        )
+
+    for checkout_id in checkout_ids:
+        if not isinstance(checkout_id, str) or not RESOURCE_ID_PATTERN.match(
+            checkout_id
+        ):
+            raise ValidationError(
+                "checkout_ids cannot contain empty or invalid IDs",
+                field="checkout_ids",
+                value=checkout_id,
+            )
+
+    # The client's own request slots cap how many lookups are in flight
+    responses = await asyncio.gather(
+        *(
+            retrieve_checkout(client, checkout_id, sub_account_id=sub_account_id)
+            for checkout_id in checkout_ids
+        )
+    )
+    return {"data": [response["data"] for response in responses]}
@@ -9,11 +9,31 @@ from __future__ import annotations
 from typing import Any
 
 from ..core import JustiFiClient
-from .base import ToolError, ValidationError
+from .base import RESOURCE_ID_PATTERN, ValidationError, handle_tool_errors
 from .response_formatter import standardize_response
 from .utils.payment_security import validate_payment_creation
 
+# Checkout API endpoints, formatted with the checkout ID
+_PATHS = {
+    "create": "/v1/checkouts",
+    "update": "/v1/checkouts/{id}",
+    "complete": "/v1/checkouts/{id}/complete",
+    "expire": "/v1/checkouts/{id}/expire",
+}
 
+# Lowercase codes sent as-is; other input is shape-checked and lowercased
+_CURRENCIES = frozenset(("usd", "cad"))
+
+# Optional create_checkout fields: (name, expected type, error message)
+_CREATE_OPTIONAL_FIELDS = (
+    ("success_url", str, "success_url must be a string if provided"),
+    ("cancel_url", str, "cancel_url must be a string if provided"),
+    ("metadata", dict, "metadata must be a dictionary if provided"),
+    ("expires_at", str, "expires_at must be an ISO 8601 timestamp string if provided"),
+)
+
+
+@handle_tool_errors
 async def create_checkout(
     client: JustiFiClient,
     amount: int,
@@ -78,75 +98,47 @@ async def create_checkout(
         )
 
     # Validate optional parameters
-    if not isinstance(currency, str) or len(currency) != 3:
-        raise ValidationError(
-            "currency must be a 3-character currency code",
-            field="currency",
-            value=currency,
-        )
-
-    if success_url is not None and not isinstance(success_url, str):
-        raise ValidationError(
-            "success_url must be a string if provided",
-            field="success_url",
-            value=success_url,
-        )
-
-    if cancel_url is not None and not isinstance(cancel_url, str):
-        raise ValidationError(
-            "cancel_url must be a string if provided",
-            field="cancel_url",
-            value=cancel_url,
-        )
-
-    if metadata is not None and not isinstance(metadata, dict):
-        raise ValidationError(
-            "metadata must be a dictionary if provided",
-            field="metadata",
-            value=metadata,
-        )
-
-    if expires_at is not None and not isinstance(expires_at, str):
-        raise ValidationError(
-            "expires_at must be an ISO 8601 timestamp string if provided",
-            field="expires_at",
-            value=expires_at,
-        )
-
-    try:
-        # Build request payload
-        payload: dict[str, Any] = {
-            "amount": amount,
-            "currency": currency.lower(),
-            "description": description,
-            "payment_method_group_id": payment_method_group_id,
-        }
-
-        if success_url:
-            payload["success_url"] = success_url
-
-        if cancel_url:
-            payload["cancel_url"] = cancel_url
-
-        if metadata:
-            payload["metadata"] = metadata
-
-        if expires_at:
-            payload["expires_at"] = expires_at
-
-        # Call JustiFi API to create checkout
-        result = await client.request(
-            "POST", "/v1/checkouts", data=payload, sub_account_id=sub_account_id
-        )
-        return standardize_response(result, "create_checkout")
-
-    except Exception as e:
-        raise ToolError(
-            f"Failed to create checkout: {str(e)}",
-            error_type="CheckoutCreationError",
-        ) from e
-
-
+    if not (isinstance(currency, str) and currency in _CURRENCIES):
+        if (
+            not isinstance(currency, str)
+            or len(currency) != 3
+            or not currency.isalpha()
+        ):
+            raise ValidationError(
+                "currency must be a 3-character currency code",
+                field="currency",
+                value=currency,
+            )
+        currency = currency.lower()
+
+    optional_fields = {
+        "success_url": success_url,
+        "cancel_url": cancel_url,
+        "metadata": metadata,
+        "expires_at": expires_at,
+    }
+    for name, expected_type, message in _CREATE_OPTIONAL_FIELDS:
+        value = optional_fields[name]
+        if value is not None and not isinstance(value, expected_type):
+            raise ValidationError(message, field=name, value=value)
+
+    # Build request payload
+    payload: dict[str, Any] = {
+        "amount": amount,
+        "currency": currency,
+        "description": description,
+        "payment_method_group_id": payment_method_group_id,
+    }
+    payload.update({key: value for key, value in optional_fields.items() if value})
+
+    # Call JustiFi API to create checkout
+    result = await client.request(
+        "POST", _PATHS["create"], data=payload, sub_account_id=sub_account_id
+    )
+    return standardize_response(result, "create_checkout")
+
+
+@handle_tool_errors
 async def update_checkout(
     client: JustiFiClient,
     checkout_id: str,
@@ -178,9 +170,9 @@ async def update_checkout(
     validate_payment_creation(client.base_url, client.client_id)
 
     # Validate required parameters
-    if not checkout_id or not isinstance(checkout_id, str):
+    if not isinstance(checkout_id, str) or not RESOURCE_ID_PATTERN.match(checkout_id):
         raise ValidationError(
-            "checkout_id is required and must be a non-empty string",
+            "checkout_id is required and must be a valid checkout ID",
             field="checkout_id",
             value=checkout_id,
         )
@@ -207,43 +199,36 @@ async def update_checkout(
             value=expires_at,
         )
 
+    # Build request payload with only provided fields
+    payload: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("description", description),
+            ("metadata", metadata),
+            ("expires_at", expires_at),
+        )
+        if value is not None
+    }
+
     # Ensure at least one field is being updated
-    if all(param is None for param in [description, metadata, expires_at]):
+    if not payload:
         raise ValidationError(
             "At least one field must be provided for update",
             field="update_fields",
             value=None,
         )
 
-    try:
-        # Build request payload with only provided fields
-        payload: dict[str, Any] = {}
-
-        if description is not None:
-            payload["description"] = description
-
-        if metadata is not None:
-            payload["metadata"] = metadata
-
-        if expires_at is not None:
-            payload["expires_at"] = expires_at
-
-        # Call JustiFi API to update checkout
-        result = await client.request(
-            "PATCH",
-            f"/v1/checkouts/{checkout_id}",
-            data=payload,
-            sub_account_id=sub_account_id,
-        )
-        return standardize_response(result, "update_checkout")
-
-    except Exception as e:
-        raise ToolError(
-            f"Failed to update checkout {checkout_id}: {str(e)}",
-            error_type="CheckoutUpdateError",
-        ) from e
+    # Call JustiFi API to update checkout
+    result = await client.request(
+        "PATCH",
+        _PATHS["update"].format(id=checkout_id),
+        data=payload,
+        sub_account_id=sub_account_id,
+    )
+    return standardize_response(result, "update_checkout")
 
 
+@handle_tool_errors
 async def complete_checkout(
     client: JustiFiClient,
     checkout_id: str,
@@ -271,9 +256,9 @@ async def complete_checkout(
     validate_payment_creation(client.base_url, client.client_id)
 
     # Validate required parameters
-    if not checkout_id or not isinstance(checkout_id, str):
+    if not isinstance(checkout_id, str) or not RESOURCE_ID_PATTERN.match(checkout_id):
         raise ValidationError(
-            "checkout_id is required and must be a non-empty string",
+            "checkout_id is required and must be a valid checkout ID",
             field="checkout_id",
             value=checkout_id,
         )
@@ -285,28 +270,22 @@ async def complete_checkout(
             value=payment_method_id,
         )
 
-    try:
-        # Build request payload
-        payload = {
-            "payment_method_id": payment_method_id,
-        }
-
-        # Call JustiFi API to complete checkout
-        result = await client.request(
-            "POST",
-            f"/v1/checkouts/{checkout_id}/complete",
-            data=payload,
-            sub_account_id=sub_account_id,
-        )
-        return standardize_response(result, "complete_checkout")
+    # Build request payload
+    payload = {
+        "payment_method_id": payment_method_id,
+    }
 
-    except Exception as e:
-        raise ToolError(
-            f"Failed to complete checkout {checkout_id}: {str(e)}",
-            error_type="CheckoutCompletionError",
-        ) from e
+    # Call JustiFi API to complete checkout
+    result = await client.request(
+        "POST",
+        _PATHS["complete"].format(id=checkout_id),
+        data=payload,
+        sub_account_id=sub_account_id,
+    )
+    return standardize_response(result, "complete_checkout")
 
 
+@handle_tool_errors
 async def expire_checkout(
     client: JustiFiClient,
     checkout_id: str,
@@ -332,24 +311,17 @@ async def expire_checkout(
     validate_payment_creation(client.base_url, client.client_id)
 
     # Validate required parameters
-    if not checkout_id or not isinstance(checkout_id, str):
+    if not isinstance(checkout_id, str) or not RESOURCE_ID_PATTERN.match(checkout_id):
         raise ValidationError(
-            "checkout_id is required and must be a non-empty string",
+            "checkout_id is required and must be a valid checkout ID",
             field="checkout_id",
             value=checkout_id,
         )
 
-    try:
-        # Call JustiFi API to expire checkout
-        result = await client.request(
-            "POST",
-            f"/v1/checkouts/{checkout_id}/expire",
-            sub_account_id=sub_account_id,
-        )
-        return standardize_response(result, "expire_checkout")
-
-    except Exception as e:
-        raise ToolError(
-            f"Failed to expire checkout {checkout_id}: {str(e)}",
-            error_type="CheckoutExpirationError",
-        ) from e
+    # Call JustiFi API to expire checkout
+    result = await client.request(
+        "POST",
+        _PATHS["expire"].format(id=checkout_id),
+        sub_account_id=sub_account_id,
+    )
+    return standardize_response(result, "expire_checkout")
@@ -6,10 +6,11 @@ These tools generate production-ready code tailored to specific frameworks and u
 
 from __future__ import annotations
 
+from importlib import resources
 from typing import Any
 
 from ..core import JustiFiClient
-from .base import ToolError, handle_tool_errors
+from .base import handle_tool_errors
 from .response_formatter import standardize_response
 
 
@@ -35,68 +36,76 @@ async def generate_unified_checkout_integration(
     Returns:
         Dictionary with complete Express.js example, framework-agnostic patterns,
         setup instructions, and comprehensive documentation
-
-    Raises:
-        ToolError: If code generation fails
     """
+    return _copy_response()
 
-    try:
-        # Generate complete working Express.js example
-        backend_code = _generate_express_backend()
-        frontend_code = _generate_vanilla_frontend()
-        config = _generate_configuration()
-        tests = _generate_test_suite()
-
-        # Generate framework-agnostic integration patterns
-        patterns = _generate_integration_patterns()
-
-        # Combine everything into comprehensive response
-        all_files = {
-            **backend_code,
-            **frontend_code,
-            **config,
-            **tests,
-            **patterns,
-        }
-
-        result = {
-            "success": True,
-            "description": "Complete JustiFi checkout integration: Express.js example + framework-agnostic patterns",
-            "files": all_files,
-            "resources": _get_justifi_resources(),
-            "next_steps": _get_comprehensive_next_steps(),
-            "working_example": "Express.js + vanilla HTML (ready to run)",
-            "adaptable_patterns": "Framework-agnostic code snippets for any technology stack",
-        }
 
-        return standardize_response(result, "generate_unified_checkout_integration")
+def _copy_response() -> dict[str, Any]:
+    """Copy the precomputed response's containers, sharing its strings.
 
-    except Exception as e:
-        raise ToolError(
-            f"Failed to generate checkout integration: {str(e)}",
-            error_type="CodeGenerationError",
-        ) from e
+    Callers may mutate what a tool returns, so each gets its own dicts and
+    lists; the template strings are immutable and safe to share.
+    """
+    (integration,) = _RESPONSE["data"]
+    return {
+        "data": [
+            {
+                **integration,
+                "files": dict(integration["files"]),
+                "resources": {
+                    section: dict(links)
+                    for section, links in integration["resources"].items()
+                },
+                "next_steps": list(integration["next_steps"]),
+            }
+        ],
+        "metadata": dict(_RESPONSE["metadata"]),
+    }
 
 
-def _generate_backend_code(framework: str, features: list[str]) -> dict[str, str]:
-    """Generate backend code - provides Express.js example for all frameworks."""
-    # Always return Express.js implementation regardless of requested framework
-    # LLMs should translate this example using the comprehensive YAML translation guide
-    return _generate_express_backend(features)
+def _build_integration() -> dict[str, Any]:
+    """Assemble the integration payload."""
+    # Complete working Express.js example plus configuration and tests
+    all_files = {
+        "server.js": _EXPRESS_SERVER_JS,
+        "package.json": _EXPRESS_PACKAGE_JSON,
+        "public/index.html": _VANILLA_INDEX_HTML,
+        ".env.example": _ENV_EXAMPLE,
+        "justifi-integration-guide.yaml": _INTEGRATION_GUIDE_YAML,
+        "README.md": _README_MD,
+        "tests/checkout.test.js": _CHECKOUT_TEST_JS,
+    }
 
+    result = {
+        "success": True,
+        "description": "Complete JustiFi checkout integration: Express.js example + framework-agnostic patterns",
+        "files": all_files,
+        "resources": _JUSTIFI_RESOURCES,
+        "next_steps": _NEXT_STEPS,
+        "working_example": "Express.js + vanilla HTML (ready to run)",
+        "adaptable_patterns": "Framework-agnostic code snippets for any technology stack",
+    }
+    return result
 
-def _generate_express_backend() -> dict[str, str]:
-    """Generate Express.js backend code that actually works."""
 
-    server_code = """require('dotenv').config();
+# Generated file bodies are static module-level constants, assembled into the
+# files map by _build_integration.
+_EXPRESS_SERVER_JS = """require('dotenv').config();
 const express = require('express');
 const app = express();
 
 app.use(express.json());
 app.use(express.static('public'));
 
+// Resolved once at startup instead of on every request
+const JUSTIFI_BASE_URL = process.env.JUSTIFI_BASE_URL;
+const OAUTH_TOKEN_URL = `${JUSTIFI_BASE_URL}/oauth/token`;
+const CHECKOUTS_URL = `${JUSTIFI_BASE_URL}/v1/checkouts`;
+const WEB_COMPONENT_TOKENS_URL = `${JUSTIFI_BASE_URL}/v1/web_component_tokens`;
+const NON_BLANK = /\\S/;
+
 async function getAccessToken() {
-    const response = await fetch(`${process.env.JUSTIFI_BASE_URL}/oauth/token`, {
+    const response = await fetch(OAUTH_TOKEN_URL, {
         method: 'POST',
         headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
         body: new URLSearchParams({
@@ -114,71 +123,40 @@ async function getAccessToken() {
     return tokenData.access_token;
 }
 
-// API endpoint: Create checkout
-app.post('/api/checkout', async (req, res) => {
-    try {
-        const { amount, description } = req.body;
-
-        if (!amount || amount < 100) {
-            return res.status(400).json({ success: false, error: 'Amount must be at least $1.00' });
-        }
-        if (!description) {
-            return res.status(400).json({ success: false, error: 'Description is required' });
-        }
-
-        const token = await getAccessToken();
-
-        // Step 1: Create checkout
-        const checkoutResponse = await fetch(`${process.env.JUSTIFI_BASE_URL}/v1/checkouts`, {
-            method: 'POST',
-            headers: {
-                'Authorization': `Bearer ${token}`,
-                'Content-Type': 'application/json',
-                'Sub-Account': process.env.JUSTIFI_SUB_ACCOUNT_ID
-            },
-            body: JSON.stringify({
-                amount: parseInt(amount),
-                description: description,
-                origin_url: 'localhost:3001'  // No http:// prefix!
-            })
-        });
-
-        if (!checkoutResponse.ok) {
-            throw new Error(`Checkout failed: ${checkoutResponse.status}`);
-        }
+// Authenticated JSON POST to the JustiFi API
+async function justifiPost(label, url, token, body, extraHeaders = {}) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+            'Authorization': `Bearer ${token}`,
+            'Content-Type': 'application/json',
+            ...extraHeaders
+        },
+        body: JSON.stringify(body)
+    });
 
-        const checkout = await checkoutResponse.json();
-        const checkoutId = checkout.data.id;
+    if (!response.ok) {
+        throw new Error(`${label} failed: ${response.status}`);
+    }
 
-        // Step 2: Get web component token for this checkout (NO Sub-Account header needed)
-        const tokenResponse = await fetch(`${process.env.JUSTIFI_BASE_URL}/v1/web_component_tokens`, {
-            method: 'POST',
-            headers: {
-                'Authorization': `Bearer ${token}`,
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                resources: [
-                    `write:tokenize:${process.env.JUSTIFI_SUB_ACCOUNT_ID}`,
-                    `write:checkout:${checkoutId}`
-                ]
-            })
-        });
+    return response.json();
+}
 
-        if (!tokenResponse.ok) {
-            throw new Error(`Web component token failed: ${tokenResponse.status}`);
-        }
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
 
-        const tokenData = await tokenResponse.json();
-        const webComponentToken = tokenData.access_token;
+function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
+}
 
-        // Step 3: Render checkout page with embedded data (SSR pattern)
-        const checkoutHtml = `<!DOCTYPE html>
+// Checkout page template; user-supplied text is escaped before it is embedded
+function renderCheckoutPage({ description, amount, checkoutId, webComponentToken }) {
+    const safeDescription = escapeHtml(description);
+    return `<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Checkout - ${description}</title>
+    <title>Checkout - ${safeDescription}</title>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@justifi/webcomponents@5.7.6/dist/webcomponents/webcomponents.css"/>
     <style>
         body {
@@ -202,7 +180,7 @@ app.post('/api/checkout', async (req, res) => {
         <h1>Complete Your Payment</h1>
         <div class="order-summary">
             <h3>Order Summary</h3>
-            <p><strong>Description:</strong> ${description}</p>
+            <p><strong>Description:</strong> ${safeDescription}</p>
             <p class="amount"><strong>Total:</strong> $${(parseInt(amount) / 100).toFixed(2)}</p>
         </div>
         <div id="checkout-container"></div>
@@ -236,6 +214,41 @@ app.post('/api/checkout', async (req, res) => {
     </script>
 </body>
 </html>`;
+}
+
+// API endpoint: Create checkout
+app.post('/api/checkout', async (req, res) => {
+    try {
+        const { amount, description } = req.body;
+
+        if (!amount || amount < 100) {
+            return res.status(400).json({ success: false, error: 'Amount must be at least $1.00' });
+        }
+        if (typeof description !== 'string' || !NON_BLANK.test(description)) {
+            return res.status(400).json({ success: false, error: 'Description is required' });
+        }
+
+        const token = await getAccessToken();
+
+        // Step 1: Create checkout
+        const checkout = await justifiPost('Checkout', CHECKOUTS_URL, token, {
+            amount: parseInt(amount),
+            description: description,
+            origin_url: 'localhost:3001'  // No http:// prefix!
+        }, { 'Sub-Account': process.env.JUSTIFI_SUB_ACCOUNT_ID });
+        const checkoutId = checkout.data.id;
+
+        // Step 2: Get web component token for this checkout (NO Sub-Account header needed)
+        const tokenData = await justifiPost('Web component token', WEB_COMPONENT_TOKENS_URL, token, {
+            resources: [
+                `write:tokenize:${process.env.JUSTIFI_SUB_ACCOUNT_ID}`,
+                `write:checkout:${checkoutId}`
+            ]
+        });
+        const webComponentToken = tokenData.access_token;
+
+        // Step 3: Render checkout page with embedded data (SSR pattern)
+        const checkoutHtml = renderCheckoutPage({ description, amount, checkoutId, webComponentToken });
 
         res.setHeader('Content-Type', 'text/html');
         res.send(checkoutHtml);
@@ -248,15 +261,7 @@ app.post('/api/checkout', async (req, res) => {
 
 app.listen(process.env.PORT || 3001);"""
 
-    return {
-        "server.js": server_code,
-        "package.json": _generate_express_package_json(),
-    }
-
-
-def _generate_express_package_json() -> str:
-    """Generate package.json for Express backend."""
-    return """{
+_EXPRESS_PACKAGE_JSON = """{
   "name": "justifi-checkout-integration",
   "version": "1.0.0",
   "description": "JustiFi checkout integration with Express.js",
@@ -278,24 +283,7 @@ def _generate_express_package_json() -> str:
 }"""
 
 
-def _generate_frontend_code(frontend: str, features: list[str]) -> dict[str, str]:
-    """Generate frontend code for specified framework."""
-    if frontend == "vanilla":
-        return _generate_vanilla_frontend(features)
-    elif frontend == "react":
-        return _generate_react_frontend(features)
-    elif frontend == "vue":
-        return _generate_vue_frontend(features)
-    elif frontend == "angular":
-        return _generate_angular_frontend(features)
-    else:
-        raise ValueError(f"Unsupported frontend: {frontend}")
-
-
-def _generate_vanilla_frontend() -> dict[str, str]:
-    """Generate minimal working frontend with clear security warnings."""
-
-    html_code = """<!DOCTYPE html>
+_VANILLA_INDEX_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>JustiFi Checkout</title>
@@ -347,33 +335,8 @@ def _generate_vanilla_frontend() -> dict[str, str]:
 </body>
 </html>"""
 
-    return {
-        "public/index.html": html_code,
-    }
-
 
-def _generate_react_frontend(features: list[str]) -> dict[str, str]:
-    """Generate React frontend code."""
-    # Implementation for React would go here
-    return {"CheckoutComponent.jsx": "// React implementation coming soon"}
-
-
-def _generate_vue_frontend(features: list[str]) -> dict[str, str]:
-    """Generate Vue frontend code."""
-    # Implementation for Vue would go here
-    return {"CheckoutComponent.vue": "// Vue implementation coming soon"}
-
-
-def _generate_angular_frontend(features: list[str]) -> dict[str, str]:
-    """Generate Angular frontend code."""
-    # Implementation for Angular would go here
-    return {"checkout.component.ts": "// Angular implementation coming soon"}
-
-
-def _generate_configuration() -> dict[str, str]:
-    """Generate configuration files."""
-
-    env_template = """# JustiFi API Configuration (Required)
+_ENV_EXAMPLE = """# JustiFi API Configuration (Required)
 JUSTIFI_CLIENT_ID=test_your_client_id
 JUSTIFI_CLIENT_SECRET=test_your_client_secret
 JUSTIFI_SUB_ACCOUNT_ID=acc_your_sub_account_id
@@ -381,170 +344,15 @@ JUSTIFI_BASE_URL=https://api.justifi.ai
 PORT=3001
 NODE_ENV=development"""
 
-    yaml_instructions = """# JustiFi Integration Requirements (v5.7.6+)
-
-# Essential Setup
-setup:
-  script_tag: '<script type="module" src="https://cdn.jsdelivr.net/npm/@justifi-tech/justifi-webcomponents@5.7.6/dist/index.js"></script>'
-  token_scope: "write:tokenize:${accountId}"
-  origin_url: "localhost:3001"  # NO http:// prefix
-  component_attributes:
-    - 'disable-card-form="false"'
-    - 'disable-bnpl-form="false"'
-    - 'disable-bank-account-form="false"'
-
-# Security (Critical)
-security:
-  - Frontend NEVER calls api.justifi.ai directly
-  - Only frontend action: form submit to YOUR backend /api/checkout
-  - Backend handles all JustiFi API calls with Sub-Account header
-  - OAuth client credentials flow server-side only
-  - Data embedded in server-rendered HTML (no client-side token exposure)
-
-# Integration Flow (Server-Side Rendering Pattern)
-flow:
-  1: "Frontend form submits to /api/checkout with amount & description"
-  2: "Backend creates checkout + gets web component token"
-  3: "Backend renders and returns complete checkout page with data embedded"
-  4: "Frontend checkout page loads with checkout ID & token already in HTML"
-  5: "No additional API calls - classic SSR pattern"
-
-# Framework Translation Patterns (for LLMs)
-framework_patterns:
-  api_route_pattern: "POST /api/checkout → validate input → oauth token → justifi api call → return response"
-  error_handling_pattern: "try/catch → log error → return structured error response with status codes"
-  oauth_token_pattern: "fetch oauth token → use for authenticated API calls"
-  input_validation_pattern: "amount >= 100 && description.trim().length > 0 && typeof amount === integer"
-  oauth_flow_pattern: "POST oauth/token with client_credentials → get access_token → use Bearer token for API calls"
-
-security_patterns:
-  frontend_rule: "Frontend only calls YOUR backend APIs, never api.justifi.ai directly"
-  backend_rule: "Backend includes Sub-Account header on all authenticated JustiFi API calls"
-  environment_rule: "Keep all credentials server-side only, never expose in frontend"
-  validation_rule: "Always validate user input before making API calls"
-
-# Event Handlers
-events:
-  submit-event: "Payment successful (contains payment_id)"
-  error-event: "Payment failed (contains error message)"
-
-# Test Cards
-test_cards:
-  success: "4242424242424242"
-  decline: "4000000000000002"
-
-# Common Dependencies (by Language)
-common_dependencies:
-  javascript:
-    http_clients: ["axios", "fetch (built-in)", "got", "node-fetch"]
-    environment: ["dotenv", "@types/node (TypeScript)"]
-    frameworks: ["express", "next", "fastify", "koa"]
-
-  python:
-    http_clients: ["requests", "httpx", "urllib3", "aiohttp"]
-    environment: ["python-dotenv", "pydantic (validation)"]
-    frameworks: ["fastapi", "django", "flask", "starlette"]
-
-  go:
-    http_clients: ["net/http (standard)", "resty", "gentleman"]
-    environment: ["godotenv", "viper", "envconfig"]
-    frameworks: ["gin", "echo", "fiber", "net/http (standard)"]
-
-  php:
-    http_clients: ["guzzlehttp/guzzle", "curl", "file_get_contents"]
-    environment: ["vlucas/phpdotenv", "symfony/dotenv"]
-    frameworks: ["laravel", "symfony", "slim", "vanilla-php"]
-
-  ruby:
-    http_clients: ["httparty", "net/http", "faraday", "rest-client"]
-    environment: ["dotenv", "figaro", "config"]
-    frameworks: ["rails", "sinatra", "hanami", "roda"]
-
-# Language Translation Hints (for LLMs)
-language_hints:
-  javascript:
-    async_pattern: "Use async/await with fetch() or axios"
-    error_handling: "try/catch blocks, throw new Error()"
-    env_vars: "process.env.VARIABLE_NAME"
-    json_handling: "JSON.stringify() and response.json()"
-
-  python:
-    async_pattern: "Use requests.post() or httpx.AsyncClient()"
-    error_handling: "try/except blocks, raise Exception()"
-    env_vars: "os.getenv('VARIABLE_NAME')"
-    json_handling: "response.json() and json.dumps()"
-
-  go:
-    async_pattern: "Use net/http.Client with context.Context"
-    error_handling: "if err != nil { return nil, err }"
-    env_vars: "os.Getenv() with validation"
-    json_handling: "json.Marshal() and json.Unmarshal()"
-
-  php:
-    async_pattern: "Use Guzzle or cURL with timeout settings"
-    error_handling: "try/catch blocks, throw new Exception()"
-    env_vars: "$_ENV['VARIABLE_NAME'] with validation"
-    json_handling: "json_encode() and json_decode()"
-
-  ruby:
-    async_pattern: "Use HTTParty or Net::HTTP with proper headers"
-    error_handling: "rescue blocks, raise StandardError"
-    env_vars: "ENV['VARIABLE_NAME'] with fallbacks"
-    json_handling: "to_json and JSON.parse()"
-
-# Common Fixes
-fixes:
-  "Unexpected token export": "Add type='module' to script tag"
-  "403 Forbidden": "Remove http:// from origin_url, add Sub-Account header"
-  "Only card payments": "Add all disable-*-form='false' attributes"
-  "CORS errors": "Frontend calling JustiFi directly (use backend instead)"
-
-# TypeScript Definitions (Universal)
-typescript_definitions: |
-  interface JustiFiCheckout {
-    id: string;
-    amount: number;  // integer in cents (e.g., 2999 = $29.99)
-    description: string;
-    status: 'pending' | 'completed' | 'failed' | 'canceled';
-    created_at: string;
-    updated_at: string;
-  }
+# Large enough to live in its own file; read once when the module loads
+_INTEGRATION_GUIDE_YAML = (
+    resources.files(__package__)
+    .joinpath("data", "justifi-integration-guide.yaml")
+    .read_text(encoding="utf-8")
+    .rstrip("\n")
+)
 
-  interface OAuthResponse {
-    access_token: string;
-    expires_in: number;
-    token_type: 'Bearer';
-  }
-
-  interface WebComponentToken {
-    access_token: string;
-    expires_in: number;
-    issued_at: string;
-  }
-
-  interface CheckoutRequest {
-    amount: number;
-    description: string;
-    origin_url?: string;
-  }
-
-  interface APIResponse<T> {
-    success: boolean;
-    data?: T;
-    error?: string;
-  }
-
-# Official Resources
-resources:
-  examples: "https://github.com/justifi-tech/web-component-library/tree/main/apps/component-examples"
-  storybook: "https://storybook.justifi.ai"
-  docs: "https://docs.justifi.ai/api-spec"
-"""
-
-    return {
-        ".env.example": env_template.strip(),
-        "justifi-integration-guide.yaml": yaml_instructions.strip(),
-        "README.md": """# JustiFi Checkout Integration
+_README_MD = """# JustiFi Checkout Integration
 
 ## Quick Start
 
@@ -572,20 +380,10 @@ resources:
 - Origin URL: `localhost:3001` (no http:// prefix)
 - Security: Never call JustiFi API directly from frontend
 
-See `justifi-integration-guide.yaml` for complete implementation details and troubleshooting.
-""".strip(),
-    }
-
+See `justifi-integration-guide.yaml` for complete implementation details and troubleshooting."""
 
-def _generate_integration_patterns() -> dict[str, str]:
-    """Generate minimal framework patterns."""
-    return {}
 
-
-def _generate_test_suite() -> dict[str, str]:
-    """Generate test suite."""
-    test_code = """
-const request = require('supertest');
+_CHECKOUT_TEST_JS = """const request = require('supertest');
 const app = require('./server');
 
 describe('JustiFi Checkout Integration', () => {
@@ -636,126 +434,72 @@ describe('JustiFi Checkout Integration', () => {
 
         expect(response.body.status).toBe('ok');
     });
-});
-"""
-
-    return {
-        "tests/checkout.test.js": test_code.strip(),
-    }
-
-
-def _generate_setup_instructions(
-    framework: str, frontend: str, features: list[str]
-) -> list[str]:
-    """Generate step-by-step setup instructions."""
-
-    instructions = [
-        "1. Set up your environment variables in .env file",
-        "2. Install dependencies with your package manager",
-        "3. Start the development server",
-        "4. Open the application in your browser",
-        "5. Test with the provided test cards",
-    ]
-
-    if "webhooks" in features:
-        instructions.append("6. Set up webhook endpoints for payment events")
-
-    if "saved-cards" in features:
-        instructions.append("7. Configure database for storing payment method tokens")
-
-    if "subscriptions" in features:
-        instructions.append("8. Implement subscription management endpoints")
-
-    return instructions
-
-
-def _get_justifi_resources() -> dict[str, dict[str, str]]:
-    """Get comprehensive JustiFi resources for LLM reference."""
-    return {
-        "documentation": {
-            "context7": "https://context7.justifi.ai - Comprehensive integration guides and tutorials",
-            "api_reference": "https://docs.justifi.ai/api-spec - Complete API documentation with examples",
-            "getting_started": "https://docs.justifi.ai/guide - Step-by-step integration guide",
-            "github_docs": "https://github.com/justifi-tech/docs - Open source documentation repository",
-            "openapi_spec": "https://api.justifi.ai/openapi.yaml - Machine-readable API specification",
-            "authentication_guide": "https://docs.justifi.ai/api-spec#section/Authentication - OAuth implementation details",
-            "checkout_guide": "https://docs.justifi.ai/guide/checkouts - Checkout integration walkthrough",
-        },
-        "web_components": {
-            "storybook_main": "https://storybook.justifi.ai - Interactive component playground and documentation",
-            "checkout_component": "https://storybook.justifi.ai/?path=/docs/payment-facilitation-unified-fintech-checkout--docs - Checkout component documentation",
-            "component_library": "https://github.com/justifi-tech/web-component-library - Web components source code",
-            "official_examples": "https://github.com/justifi-tech/web-component-library/tree/main/apps/component-examples - Official working examples",
-            "express_checkout_example": "https://raw.githubusercontent.com/justifi-tech/web-component-library/refs/heads/main/apps/component-examples/examples/checkout.js - Official Express.js checkout example",
-            "styling_guide": "https://storybook.justifi.ai/?path=/docs/design-system-overview--docs - Component styling and theming",
-            "cdn_url": "https://cdn.jsdelivr.net/npm/@justifi-tech/justifi-webcomponents@latest/dist/index.js - Web components CDN",
-        },
-        "testing": {
-            "test_cards": "https://docs.justifi.ai/testing/test-cards - Test card numbers and expected results",
-            "sandbox_environment": "https://docs.justifi.ai/guide/environments - Test environment setup",
-            "api_testing": "https://docs.justifi.ai/api-spec#section/Testing - API testing guidelines",
-            "webhook_testing": "https://docs.justifi.ai/guide/webhooks - Webhook testing and validation",
-        },
-        "troubleshooting": {
-            "common_errors": "https://docs.justifi.ai/troubleshooting/common-errors - Common integration issues",
-            "authentication_errors": "https://docs.justifi.ai/troubleshooting/authentication - OAuth troubleshooting",
-            "checkout_errors": "https://docs.justifi.ai/troubleshooting/checkout-errors - Checkout-specific issues",
-            "support_discord": "https://discord.gg/justifi - Developer community support",
-        },
-        "advanced": {
-            "webhooks": "https://docs.justifi.ai/guide/webhooks - Payment status notifications",
-            "sub_accounts": "https://docs.justifi.ai/concepts/sub-accounts - Multi-tenant setup",
-            "marketplace": "https://docs.justifi.ai/use-cases/marketplace - Marketplace payment flows",
-            "pci_compliance": "https://docs.justifi.ai/compliance/pci - PCI compliance guidelines",
-        },
-    }
+});"""
+
+# Comprehensive JustiFi resources for LLM reference
+_JUSTIFI_RESOURCES: dict[str, dict[str, str]] = {
+    "documentation": {
+        "context7": "https://context7.justifi.ai - Comprehensive integration guides and tutorials",
+        "api_reference": "https://docs.justifi.ai/api-spec - Complete API documentation with examples",
+        "getting_started": "https://docs.justifi.ai/guide - Step-by-step integration guide",
+        "github_docs": "https://github.com/justifi-tech/docs - Open source documentation repository",
+        "openapi_spec": "https://api.justifi.ai/openapi.yaml - Machine-readable API specification",
+        "authentication_guide": "https://docs.justifi.ai/api-spec#section/Authentication - OAuth implementation details",
+        "checkout_guide": "https://docs.justifi.ai/guide/checkouts - Checkout integration walkthrough",
+    },
+    "web_components": {
+        "storybook_main": "https://storybook.justifi.ai - Interactive component playground and documentation",
+        "checkout_component": "https://storybook.justifi.ai/?path=/docs/payment-facilitation-unified-fintech-checkout--docs - Checkout component documentation",
+        "component_library": "https://github.com/justifi-tech/web-component-library - Web components source code",
+        "official_examples": "https://github.com/justifi-tech/web-component-library/tree/main/apps/component-examples - Official working examples",
+        "express_checkout_example": "https://raw.githubusercontent.com/justifi-tech/web-component-library/refs/heads/main/apps/component-examples/examples/checkout.js - Official Express.js checkout example",
+        "styling_guide": "https://storybook.justifi.ai/?path=/docs/design-system-overview--docs - Component styling and theming",
+        "cdn_url": "https://cdn.jsdelivr.net/npm/@justifi-tech/justifi-webcomponents@latest/dist/index.js - Web components CDN",
+    },
+    "testing": {
+        "test_cards": "https://docs.justifi.ai/testing/test-cards - Test card numbers and expected results",
+        "sandbox_environment": "https://docs.justifi.ai/guide/environments - Test environment setup",
+        "api_testing": "https://docs.justifi.ai/api-spec#section/Testing - API testing guidelines",
+        "webhook_testing": "https://docs.justifi.ai/guide/webhooks - Webhook testing and validation",
+    },
+    "troubleshooting": {
+        "common_errors": "https://docs.justifi.ai/troubleshooting/common-errors - Common integration issues",
+        "authentication_errors": "https://docs.justifi.ai/troubleshooting/authentication - OAuth troubleshooting",
+        "checkout_errors": "https://docs.justifi.ai/troubleshooting/checkout-errors - Checkout-specific issues",
+        "support_discord": "https://discord.gg/justifi - Developer community support",
+    },
+    "advanced": {
+        "webhooks": "https://docs.justifi.ai/guide/webhooks - Payment status notifications",
+        "sub_accounts": "https://docs.justifi.ai/concepts/sub-accounts - Multi-tenant setup",
+        "marketplace": "https://docs.justifi.ai/use-cases/marketplace - Marketplace payment flows",
+        "pci_compliance": "https://docs.justifi.ai/compliance/pci - PCI compliance guidelines",
+    },
+}
 
 
-def _get_express_vanilla_next_steps() -> list[str]:
-    """Get specific next steps for express-vanilla example."""
-    return [
-        "1. Copy the generated files to your project directory",
-        "2. Run 'npm install' to install dependencies",
-        "3. Copy .env.example to .env and add your JustiFi credentials",
-        "4. Start with 'npm run dev' and test at http://localhost:3001",
-        "5. For your framework, adapt the patterns shown in the 'patterns' example",
-        "6. Check Storybook for web component customization: https://storybook.justifi.ai",
-        "7. Review authentication flow in Context7: https://context7.justifi.ai",
-        "8. See API reference for additional features: https://docs.justifi.ai/api-spec",
-    ]
-
-
-def _get_patterns_next_steps() -> list[str]:
-    """Get specific next steps for patterns example."""
-    return [
-        "1. Choose your backend framework (Express, FastAPI, Django, Rails, etc.)",
-        "2. Implement the OAuth pattern in your chosen language",
-        "3. Create the 3 required API endpoints: /checkout, /web-component-token, /payment",
-        "4. Add JustiFi web component to your frontend framework",
-        "5. Test the complete flow with provided test cards",
-        "6. For complete examples, generate 'express-vanilla' type to see working code",
-        "7. Check Storybook for component integration: https://storybook.justifi.ai",
-        "8. Reference OpenAPI spec for TypeScript types: https://api.justifi.ai/openapi.yaml",
-    ]
-
-
-def _get_comprehensive_next_steps() -> list[str]:
-    """Get comprehensive next steps for the combined response."""
-    return [
-        "1. QUICK START: Run the Express.js example to see JustiFi integration working",
-        "   - Copy files to your project directory",
-        "   - Run 'npm install' to install dependencies",
-        "   - Add your JustiFi credentials to .env",
-        "   - Start with 'npm run dev' and test at http://localhost:3001",
-        "",
-        "2. ADAPT TO YOUR STACK: Use the framework-agnostic patterns",
-        "   - Review INTEGRATION_PATTERNS.md for your framework",
-        "   - Implement OAuth, checkout, and web component patterns",
-        "   - LLMs can easily translate Express patterns to Python, Ruby, etc.",
-        "",
-        "3. RESOURCES FOR DEEP INTEGRATION:",
-        "   - Storybook for web component customization: https://storybook.justifi.ai",
-        "   - Context7 for authentication flow: https://context7.justifi.ai",
-        "   - API reference for advanced features: https://docs.justifi.ai/api-spec",
-        "   - OpenAPI spec for TypeScript types: https://api.justifi.ai/openapi.yaml",
-    ]
+# Next steps for the combined response
+_NEXT_STEPS: list[str] = [
+    "1. QUICK START: Run the Express.js example to see JustiFi integration working",
+    "   - Copy files to your project directory",
+    "   - Run 'npm install' to install dependencies",
+    "   - Add your JustiFi credentials to .env",
+    "   - Start with 'npm run dev' and test at http://localhost:3001",
+    "",
+    "2. ADAPT TO YOUR STACK: Use the framework-agnostic patterns",
+    "   - Review INTEGRATION_PATTERNS.md for your framework",
+    "   - Implement OAuth, checkout, and web component patterns",
+    "   - LLMs can easily translate Express patterns to Python, Ruby, etc.",
+    "",
+    "3. RESOURCES FOR DEEP INTEGRATION:",
+    "   - Storybook for web component customization: https://storybook.justifi.ai",
+    "   - Context7 for authentication flow: https://context7.justifi.ai",
+    "   - API reference for advanced features: https://docs.justifi.ai/api-spec",
+    "   - OpenAPI spec for TypeScript types: https://api.justifi.ai/openapi.yaml",
+]
+
+
+# The payload is deterministic, so it is assembled and standardized once at
+# import; each call returns a copy of its containers.
+_RESPONSE: dict[str, Any] = standardize_response(
+    _build_integration(), "generate_unified_checkout_integration"
+)
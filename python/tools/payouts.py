@@ -157,8 +157,17 @@ async def get_payout_status(
         ValidationError: If payout_id is empty or invalid.
         ToolError: For API errors or missing response fields.
     """
-    payout_data = await retrieve_payout(
-        client, payout_id, sub_account_id=sub_account_id
+    if not payout_id or not payout_id.strip():
+        raise ValidationError(
+            "payout_id cannot be empty", field="payout_id", value=payout_id
+        )
+
+    # Bypass the GET cache: callers poll this to monitor payout progress
+    payout_data = await client.request(
+        "GET",
+        f"/v1/payouts/{payout_id}",
+        sub_account_id=sub_account_id,
+        cache=False,
     )
 
     try:
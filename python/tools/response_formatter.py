@@ -9,6 +9,57 @@ from __future__ import annotations
 
 from typing import Any
 
+# Map tool names to the data type reported in response metadata
+_TOOL_DATA_TYPES: dict[str, str] = {
+    "list_payouts": "payouts",
+    "get_recent_payouts": "payouts",
+    "retrieve_payout": "payout",
+    "get_payout_status": "payout_status",
+    "list_payments": "payments",
+    "retrieve_payment": "payment",
+    "list_disputes": "disputes",
+    "retrieve_dispute": "dispute",
+    "list_refunds": "refunds",
+    "retrieve_refund": "refund",
+    "list_payment_refunds": "payment_refunds",
+    "list_balance_transactions": "balance_transactions",
+    "retrieve_balance_transaction": "balance_transaction",
+    "list_checkouts": "checkouts",
+    "retrieve_checkout": "checkout",
+    "retrieve_checkouts": "checkouts",
+    "retrieve_payment_method": "payment_method",
+    "create_payment_method_group": "payment_method_group",
+    "list_payment_method_groups": "payment_method_groups",
+    "retrieve_payment_method_group": "payment_method_group",
+    "update_payment_method_group": "payment_method_group",
+    "remove_payment_method_from_group": "payment_method_group",
+    "list_proceeds": "proceeds",
+    "retrieve_proceed": "proceed",
+    "list_sub_accounts": "sub_accounts",
+    "get_sub_account": "sub_account",
+    "get_sub_account_payout_account": "sub_account_payout_account",
+    "get_sub_account_settings": "sub_account_settings",
+    "list_terminals": "terminals",
+    "retrieve_terminal": "terminal",
+    "update_terminal": "terminal",
+    "get_terminal_status": "terminal_status",
+    "identify_terminal": "terminal_identify",
+    # Payment creation tools
+    "create_payment": "payment",
+    "tokenize_payment_method": "payment_method",
+    "create_payment_with_card": "payment",
+    # Checkout creation tools
+    "create_checkout": "checkout",
+    "update_checkout": "checkout",
+    "complete_checkout": "checkout",
+    "expire_checkout": "checkout",
+    # Payment intent tools
+    "create_payment_intent": "payment_intent",
+    "capture_payment_intent": "payment_intent",
+    "cancel_payment_intent": "payment_intent",
+    "confirm_payment_intent": "payment_intent",
+}
+
 
 def standardize_response(
     response: dict[str, Any],
@@ -40,7 +91,10 @@ def standardize_response(
     data_type = _extract_data_type(tool_name, data_type_hint)
 
     # Handle different response formats
-    if _is_custom_format(response, tool_name):
+    if _is_standardized(response, tool_name, data_type):
+        # Already normalized by the tool itself (e.g. before wrap_tool_call)
+        return response
+    elif _is_custom_format(response, tool_name):
         # Handle custom formats like get_recent_payouts
         return _normalize_custom_response(response, tool_name, data_type)
     elif _is_api_format(response):
@@ -59,57 +113,18 @@ def _extract_data_type(tool_name: str, hint: str | None = None) -> str:
     if hint:
         return hint
 
-    # Map tool names to data types
-    type_mapping = {
-        "list_payouts": "payouts",
-        "get_recent_payouts": "payouts",
-        "retrieve_payout": "payout",
-        "get_payout_status": "payout_status",
-        "list_payments": "payments",
-        "retrieve_payment": "payment",
-        "list_disputes": "disputes",
-        "retrieve_dispute": "dispute",
-        "list_refunds": "refunds",
-        "retrieve_refund": "refund",
-        "list_payment_refunds": "payment_refunds",
-        "list_balance_transactions": "balance_transactions",
-        "retrieve_balance_transaction": "balance_transaction",
-        "list_checkouts": "checkouts",
-        "retrieve_checkout": "checkout",
-        "retrieve_payment_method": "payment_method",
-        "create_payment_method_group": "payment_method_group",
-        "list_payment_method_groups": "payment_method_groups",
-        "retrieve_payment_method_group": "payment_method_group",
-        "update_payment_method_group": "payment_method_group",
-        "remove_payment_method_from_group": "payment_method_group",
-        "list_proceeds": "proceeds",
-        "retrieve_proceed": "proceed",
-        "list_sub_accounts": "sub_accounts",
-        "get_sub_account": "sub_account",
-        "get_sub_account_payout_account": "sub_account_payout_account",
-        "get_sub_account_settings": "sub_account_settings",
-        "list_terminals": "terminals",
-        "retrieve_terminal": "terminal",
-        "update_terminal": "terminal",
-        "get_terminal_status": "terminal_status",
-        "identify_terminal": "terminal_identify",
-        # Payment creation tools
-        "create_payment": "payment",
-        "tokenize_payment_method": "payment_method",
-        "create_payment_with_card": "payment",
-        # Checkout creation tools
-        "create_checkout": "checkout",
-        "update_checkout": "checkout",
-        "complete_checkout": "checkout",
-        "expire_checkout": "checkout",
-        # Payment intent tools
-        "create_payment_intent": "payment_intent",
-        "capture_payment_intent": "payment_intent",
-        "cancel_payment_intent": "payment_intent",
-        "confirm_payment_intent": "payment_intent",
-    }
+    return _TOOL_DATA_TYPES.get(tool_name, "unknown")
+
 
-    return type_mapping.get(tool_name, "unknown")
+def _is_standardized(response: dict[str, Any], tool_name: str, data_type: str) -> bool:
+    """Check if response was already standardized for this tool and type."""
+    metadata = response.get("metadata")
+    return (
+        isinstance(metadata, dict)
+        and metadata.get("tool") == tool_name
+        and metadata.get("type") == data_type
+        and isinstance(response.get("data"), list)
+    )
 
 
 def _is_custom_format(response: dict[str, Any], tool_name: str) -> bool:
@@ -335,7 +335,10 @@ async def get_terminal_status(
 
     try:
         # Call JustiFi API to get terminal status
-        result = await client.request("GET", f"/v1/terminals/{terminal_id}/status")
+        # Bypass the GET cache: callers poll this for live connectivity
+        result = await client.request(
+            "GET", f"/v1/terminals/{terminal_id}/status", cache=False
+        )
         return standardize_response(result, "get_terminal_status")
 
     except Exception as e:
@@ -16,6 +16,7 @@ from modelcontextprotocol.auto_register import (
     discover_tools,
     extract_tool_metadata,
     get_registered_tool_count,
+    get_shared_client,
     register_single_tool,
 )
 from python.config import JustiFiConfig
@@ -238,6 +239,100 @@ class TestCreateMcpFunction:
             assert call_args[3] == "test_payout_id"
             assert result == {"test": "result"}
 
+    @pytest.mark.asyncio
+    async def test_mcp_function_closes_per_request_oauth_client(self, mock_config):
+        """Test the client built for an OAuth caller is closed after the call."""
+        from python.tools.payouts import retrieve_payout
+
+        metadata = extract_tool_metadata(retrieve_payout)
+        mcp_func = create_mcp_function(
+            "retrieve_payout", retrieve_payout, mock_config, metadata
+        )
+
+        with (
+            patch(
+                "modelcontextprotocol.auto_register.wrap_tool_call",
+                new_callable=AsyncMock,
+            ) as mock_wrap,
+            patch(
+                "modelcontextprotocol.auto_register.get_access_token",
+                return_value=MagicMock(token="user_token"),
+            ),
+            patch.object(JustiFiClient, "aclose", new_callable=AsyncMock) as aclose,
+        ):
+            await mcp_func("po_1")
+
+        client = mock_wrap.call_args[0][2]
+        assert client.bearer_token == "user_token"
+        aclose.assert_awaited_once()
+
+
+class TestSharedClient:
+    """Tests for reuse of server-credential clients across tool calls."""
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_clients(self):
+        """Isolate the module-level client registry."""
+        with patch.dict(
+            "modelcontextprotocol.auto_register._shared_clients", clear=True
+        ):
+            yield
+
+    def test_shared_client_reused_for_same_sub_account(self, mock_config):
+        """Test repeated lookups return the same client instance."""
+        first = get_shared_client(mock_config)
+
+        assert get_shared_client(mock_config) is first
+        assert first.platform_account_id is None
+
+    @pytest.mark.asyncio
+    async def test_shared_client_sub_accounts_share_state(self, mock_config):
+        """Test sub-accounts get views over one client, not new registry entries."""
+        acc_1 = get_shared_client(mock_config, "acc_1")
+        acc_2 = get_shared_client(mock_config, "acc_2")
+
+        assert acc_1.platform_account_id == "acc_1"
+        assert acc_2.platform_account_id == "acc_2"
+        assert acc_1._get_http_client() is acc_2._get_http_client()
+        assert acc_1._get_cache is acc_2._get_cache
+        assert acc_1._token_cache is acc_2._token_cache
+
+    def test_shared_client_registry_ignores_sub_account(self, mock_config):
+        """Test caller-supplied sub-accounts cannot grow the client registry."""
+        from modelcontextprotocol.auto_register import _shared_clients
+
+        for i in range(5):
+            get_shared_client(mock_config, f"acc_{i}")
+
+        assert len(_shared_clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_mcp_function_reuses_client_between_calls(self, mock_config):
+        """Test tool calls without an OAuth token share one client."""
+        from python.tools.payouts import retrieve_payout
+
+        metadata = extract_tool_metadata(retrieve_payout)
+        mcp_func = create_mcp_function(
+            "retrieve_payout", retrieve_payout, mock_config, metadata
+        )
+
+        with (
+            patch(
+                "modelcontextprotocol.auto_register.wrap_tool_call",
+                new_callable=AsyncMock,
+            ) as mock_wrap,
+            patch(
+                "modelcontextprotocol.auto_register.get_access_token",
+                return_value=None,
+            ),
+        ):
+            await mcp_func("po_1")
+            await mcp_func("po_2")
+
+        first_client = mock_wrap.call_args_list[0][0][2]
+        second_client = mock_wrap.call_args_list[1][0][2]
+        assert first_client is second_client
+
 
 class TestRegisterSingleTool:
     """Tests for single tool registration."""
@@ -146,6 +146,13 @@ class TestListBalanceTransactions:
 
         assert "limit must be an integer between 1 and 100" in str(exc_info.value)
 
+    async def test_list_balance_transactions_non_integer_limit(self, mock_client):
+        """Test list_balance_transactions rejects non-integer limits up front."""
+        with pytest.raises(ValidationError) as exc_info:
+            await list_balance_transactions(mock_client, limit="25")
+
+        assert "limit must be an integer between 1 and 100" in str(exc_info.value)
+
     async def test_list_balance_transactions_both_cursors(self, mock_client):
         """Test list_balance_transactions with both cursors (should fail)."""
         with pytest.raises(ValidationError) as exc_info:
@@ -198,6 +205,15 @@ class TestRetrieveBalanceTransaction:
             in str(exc_info.value)
         )
 
+    async def test_retrieve_balance_transaction_malformed_id(self, mock_client):
+        """Test retrieve_balance_transaction rejects IDs with path characters."""
+        with pytest.raises(ValidationError) as exc_info:
+            await retrieve_balance_transaction(mock_client, "bt_123?expand=all")
+
+        assert "balance_transaction_id contains invalid characters" in str(
+            exc_info.value
+        )
+
     async def test_retrieve_balance_transaction_none_id(self, mock_client):
         """Test retrieve_balance_transaction with None balance_transaction_id."""
         with pytest.raises(ValidationError) as exc_info:
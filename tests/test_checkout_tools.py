@@ -6,7 +6,11 @@ from httpx import Response
 
 from python.core import JustiFiClient
 from python.tools.base import ToolError, ValidationError
-from python.tools.checkouts import list_checkouts, retrieve_checkout
+from python.tools.checkouts import (
+    list_checkouts,
+    retrieve_checkout,
+    retrieve_checkouts,
+)
 
 
 @pytest.fixture
@@ -132,6 +136,13 @@ class TestRetrieveCheckout:
             await retrieve_checkout(mock_client, "   ")
         assert "checkout_id cannot be empty" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_retrieve_checkout_malformed_id(self, mock_client):
+        """Test IDs that would alter the request path are rejected locally."""
+        with pytest.raises(ValidationError) as exc_info:
+            await retrieve_checkout(mock_client, "co_123/../payouts")
+        assert "contain invalid characters" in str(exc_info.value)
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_retrieve_checkout_not_found(self, mock_client, mock_oauth_token):
@@ -146,3 +157,36 @@ class TestRetrieveCheckout:
         with pytest.raises(ToolError) as exc_info:
             await retrieve_checkout(mock_client, "co_nonexistent")
         assert "Checkout not found" in str(exc_info.value)
+
+
+class TestRetrieveCheckouts:
+    """Tests for retrieve_checkouts function."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retrieve_checkouts_preserves_order(
+        self, mock_client, mock_oauth_token
+    ):
+        """Test results come back in the order the IDs were given."""
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_oauth_token)
+        )
+        for checkout_id in ("co_1", "co_2", "co_3"):
+            respx.get(f"https://api.justifi.ai/v1/checkouts/{checkout_id}").mock(
+                return_value=Response(200, json={"data": {"id": checkout_id}})
+            )
+
+        result = await retrieve_checkouts(mock_client, ["co_3", "co_1", "co_2"])
+
+        assert [c["id"] for c in result["data"]] == ["co_3", "co_1", "co_2"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_checkouts_invalid_ids(self, mock_client):
+        """Test empty lists and malformed IDs fail before any request."""
+        with pytest.raises(ValidationError) as exc_info:
+            await retrieve_checkouts(mock_client, [])
+        assert "list of 1 to 100 checkout IDs" in str(exc_info.value)
+
+        with pytest.raises(ValidationError) as exc_info:
+            await retrieve_checkouts(mock_client, ["co_1", " "])
+        assert "cannot contain empty or invalid IDs" in str(exc_info.value)
@@ -9,7 +9,7 @@ import respx
 from httpx import Response
 
 from python.core import JustiFiClient
-from python.tools.base import ValidationError
+from python.tools.base import ToolError, ValidationError
 from python.tools.checkouts_create import (
     complete_checkout,
     create_checkout,
@@ -119,6 +119,30 @@ class TestCreateCheckout:
         assert result["data"][0]["description"] == "Test checkout"
         assert result["data"][0]["status"] == "open"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_create_checkout_api_error(self, test_client, mock_token_response):
+        """Test API failures surface as ToolError typed by the client error."""
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+        respx.post("https://api.justifi.ai/v1/checkouts").mock(
+            return_value=Response(
+                403, json={"error": {"code": "forbidden", "message": "Boom"}}
+            )
+        )
+
+        with pytest.raises(ToolError) as exc_info:
+            await create_checkout(
+                client=test_client,
+                amount=1000,
+                description="Test checkout",
+                payment_method_group_id="pmg_test123",
+            )
+
+        assert exc_info.value.error_type == "APIError"
+        assert "Boom" in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_create_checkout_production_without_test_key(self, production_client):
         """Test checkout creation fails in production without test key."""
@@ -197,6 +221,31 @@ class TestCreateCheckout:
                 currency="us",  # Too short
             )
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_create_checkout_normalizes_currency(
+        self, test_client, mock_token_response, mock_checkout_response
+    ):
+        """Test currency codes are sent to the API in lowercase."""
+        import json
+
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+        route = respx.post("https://api.justifi.ai/v1/checkouts").mock(
+            return_value=Response(200, json=mock_checkout_response)
+        )
+
+        await create_checkout(
+            client=test_client,
+            amount=1000,
+            description="Test checkout",
+            payment_method_group_id="pmg_test123",
+            currency="EUR",
+        )
+
+        assert json.loads(route.calls.last.request.content)["currency"] == "eur"
+
     @pytest.mark.asyncio
     async def test_create_checkout_invalid_urls(self, test_client):
         """Test checkout creation with invalid URL types."""
@@ -174,3 +174,333 @@ class TestSubAccountHeader:
             assert route.called
             request = route.calls[0].request
             assert request.headers.get("Sub-Account") == "acc_extra_header"
+
+
+class TestGetResponseCache:
+    """Tests for caching of idempotent GET responses."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a pre-authenticated client for testing."""
+        return JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_served_from_cache(self, mock_client):
+        """Test identical GET requests only hit the API once."""
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/payouts/po_123").mock(
+                return_value=Response(200, json={"data": {"id": "po_123"}})
+            )
+
+            first = await mock_client.request("GET", "/v1/payouts/po_123")
+            second = await mock_client.request("GET", "/v1/payouts/po_123")
+
+            assert first == second == {"data": {"id": "po_123"}}
+            assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_sub_account(self, mock_client):
+        """Test GETs for different sub-accounts are cached separately."""
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/payments").mock(
+                return_value=Response(200, json={"data": []})
+            )
+
+            await mock_client.request("GET", "/v1/payments", sub_account_id="acc_1")
+            await mock_client.request("GET", "/v1/payments", sub_account_id="acc_2")
+
+            assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(self, mock_client):
+        """Test non-GET requests clear cached GET responses."""
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            get_route = respx.get("https://api.justifi.ai/v1/checkouts/co_123").mock(
+                return_value=Response(200, json={"data": {"id": "co_123"}})
+            )
+            respx.patch("https://api.justifi.ai/v1/checkouts/co_123").mock(
+                return_value=Response(200, json={"data": {"id": "co_123"}})
+            )
+
+            await mock_client.request("GET", "/v1/checkouts/co_123")
+            await mock_client.request(
+                "PATCH", "/v1/checkouts/co_123", data={"description": "x"}
+            )
+            await mock_client.request("GET", "/v1/checkouts/co_123")
+
+            assert get_route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self):
+        """Test cache_ttl=0 disables GET caching."""
+        import respx
+        from httpx import Response
+
+        client = JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+            cache_ttl=0,
+        )
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/payouts/po_123").mock(
+                return_value=Response(200, json={"data": {"id": "po_123"}})
+            )
+
+            await client.request("GET", "/v1/payouts/po_123")
+            await client.request("GET", "/v1/payouts/po_123")
+
+            assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self):
+        """Test identical concurrent GETs are coalesced even without caching."""
+        import asyncio
+
+        import respx
+        from httpx import Response
+
+        client = JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+            cache_ttl=0,
+        )
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/checkouts/co_123").mock(
+                return_value=Response(200, json={"data": {"id": "co_123"}})
+            )
+
+            results = await asyncio.gather(
+                client.request("GET", "/v1/checkouts/co_123"),
+                client.request("GET", "/v1/checkouts/co_123"),
+                client.request("GET", "/v1/checkouts/co_123"),
+            )
+
+            assert route.call_count == 1
+            assert all(r == {"data": {"id": "co_123"}} for r in results)
+            assert client._loop_resources.inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_mutating_cached_result_does_not_affect_later_reads(
+        self, mock_client
+    ):
+        """Test each cache hit returns objects the caller owns."""
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/payouts/po_123").mock(
+                return_value=Response(200, json={"data": {"id": "po_123"}})
+            )
+
+            first = await mock_client.request("GET", "/v1/payouts/po_123")
+            first["data"]["id"] = "mutated"
+            second = await mock_client.request("GET", "/v1/payouts/po_123")
+
+            assert second == {"data": {"id": "po_123"}}
+            assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_get_separate_results(self, mock_client):
+        """Test callers joining one in-flight GET don't share result objects."""
+        import asyncio
+
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            respx.get("https://api.justifi.ai/v1/checkouts/co_123").mock(
+                return_value=Response(200, json={"data": {"id": "co_123"}})
+            )
+
+            first, second = await asyncio.gather(
+                mock_client.request("GET", "/v1/checkouts/co_123"),
+                mock_client.request("GET", "/v1/checkouts/co_123"),
+            )
+
+            assert first == second
+            assert first["data"] is not second["data"]
+
+
+class TestRequestBody:
+    """Tests for request body encoding."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a pre-authenticated client for testing."""
+        return JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+        )
+
+    @pytest.mark.asyncio
+    async def test_post_body_sent_as_json(self, mock_client):
+        """Test request data is sent as a JSON body."""
+        import json
+
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            route = respx.post("https://api.justifi.ai/v1/checkouts").mock(
+                return_value=Response(201, json={"data": {"id": "co_123"}})
+            )
+
+            await mock_client.request(
+                "POST", "/v1/checkouts", data={"amount": 1000, "currency": "usd"}
+            )
+
+            sent = route.calls.last.request
+            assert sent.headers["Content-Type"] == "application/json"
+            assert json.loads(sent.content) == {"amount": 1000, "currency": "usd"}
+
+    @pytest.mark.asyncio
+    async def test_get_sends_no_body(self, mock_client):
+        """Test GET requests are sent without a body."""
+        import respx
+        from httpx import Response
+
+        with respx.mock:
+            route = respx.get("https://api.justifi.ai/v1/payments").mock(
+                return_value=Response(200, json={"data": []})
+            )
+
+            await mock_client.request("GET", "/v1/payments")
+
+            sent = route.calls.last.request
+            assert sent.content == b""
+            assert "Content-Type" not in sent.headers
+
+
+class TestClientLifecycle:
+    """Tests for the shared HTTP client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_shared_between_calls(self):
+        """Test the pooled HTTP client is created once and reused."""
+        client = JustiFiClient("test_id", "test_secret")
+
+        assert client._get_http_client() is client._get_http_client()
+        await client.aclose()
+
+    def test_http2_enabled_only_when_h2_installed(self):
+        """Test the transport negotiates HTTP/2 only if h2 is available."""
+        import httpx
+
+        from python.core import HTTP2_AVAILABLE
+
+        client = JustiFiClient("test_id", "test_secret")
+        with patch(
+            "python.core.httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as transport:
+            client._get_http_client()
+
+        assert transport.call_args.kwargs["http2"] is HTTP2_AVAILABLE
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self):
+        """Test leaving the async context closes the pooled HTTP client."""
+        async with JustiFiClient("test_id", "test_secret") as client:
+            http_client = client._get_http_client()
+
+        assert http_client.is_closed
+        assert client._loop_resources.http_client is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_capped(self):
+        """Test bursts of requests never exceed max_concurrency in flight."""
+        import asyncio
+
+        import respx
+        from httpx import Response
+
+        client = JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+            max_concurrency=2,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_response(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(200, json={"data": {}})
+
+        with respx.mock:
+            respx.get(url__regex=r"https://api.justifi.ai/v1/checkouts/.*").mock(
+                side_effect=slow_response
+            )
+
+            await asyncio.gather(
+                *(client.request("GET", f"/v1/checkouts/co_{i}") for i in range(6))
+            )
+
+        assert peak == 2
+
+    def test_client_reused_across_event_loops(self):
+        """Test one client works under separate asyncio.run() calls."""
+        import asyncio
+
+        import respx
+        from httpx import Response
+
+        client = JustiFiClient(
+            "test_id",
+            "test_secret",
+            base_url="https://api.justifi.ai",
+            bearer_token="test_token",
+            cache_ttl=0,
+            max_concurrency=1,
+        )
+        http_clients = []
+
+        async def slow_response(request):
+            await asyncio.sleep(0.01)
+            return Response(200, json={"data": {}})
+
+        async def burst():
+            # Contending for the single request slot binds it to this loop
+            results = await asyncio.gather(
+                *(client.request("GET", f"/v1/checkouts/co_{i}") for i in range(3))
+            )
+            http_clients.append(client._get_http_client())
+            return results
+
+        with respx.mock:
+            respx.get(url__regex=r"https://api.justifi.ai/v1/checkouts/.*").mock(
+                side_effect=slow_response
+            )
+
+            assert len(asyncio.run(burst())) == 3
+            assert len(asyncio.run(burst())) == 3
+            asyncio.run(client.aclose())
+
+        assert http_clients[0] is not http_clients[1]
+        assert client._loop_resources.http_client is None
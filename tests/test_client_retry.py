@@ -116,23 +116,67 @@ class TestClientRetryLogic:
 
     @respx.mock
     async def test_network_error_retry(self, mock_client, mock_token_response):
-        """Test network errors trigger retry."""
+        """Test network errors on GETs trigger retry."""
         import httpx
 
         respx.post("https://api.justifi.ai/oauth/token").mock(
             return_value=Response(200, json=mock_token_response)
         )
 
-        # Simulate httpx.RequestError then success
-        respx.get("https://api.justifi.ai/v1/test").mock(
+        # Stale keep-alive connections surface as read errors, which the
+        # transport does not retry
+        route = respx.get("https://api.justifi.ai/v1/test").mock(
             side_effect=[
-                httpx.ConnectError("Connection failed"),
+                httpx.ReadTimeout("Read timed out"),
+                httpx.RemoteProtocolError("Server disconnected"),
                 Response(200, json={"data": "success"}),
             ]
         )
 
         result = await mock_client.request("GET", "/v1/test", retries=2)
+
         assert result == {"data": "success"}
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_network_error_on_write_not_retried(
+        self, mock_client, mock_token_response
+    ):
+        """Test network errors on writes surface as APIError without retrying."""
+        import httpx
+
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+
+        # The request may have reached the server, so it must not be resent
+        route = respx.post("https://api.justifi.ai/v1/test").mock(
+            side_effect=[
+                httpx.ReadTimeout("Read timed out"),
+                Response(200, json={"data": "success"}),
+            ]
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            await mock_client.request("POST", "/v1/test", data={}, retries=2)
+
+        assert exc_info.value.error_code == "connection_error"
+        assert route.call_count == 1
+
+    async def test_transport_retries_connection_errors(self, mock_client):
+        """Test the shared client's transport is configured to retry connects."""
+        from unittest.mock import patch
+
+        import httpx
+
+        from python.core import TRANSPORT_RETRIES
+
+        with patch(
+            "python.core.httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as transport:
+            mock_client._get_http_client()
+
+        assert transport.call_args.kwargs["retries"] == TRANSPORT_RETRIES
 
     @respx.mock
     async def test_retry_disabled(self, mock_client, mock_token_response):
@@ -151,6 +195,56 @@ class TestClientRetryLogic:
         # Should only make one attempt
         assert len(respx.calls) == 2  # 1 OAuth + 1 API call
 
+    @respx.mock
+    async def test_rate_limit_honors_retry_after(
+        self, mock_client, mock_token_response
+    ):
+        """Test 429 responses use the Retry-After header as the backoff base."""
+        from unittest.mock import AsyncMock, patch
+
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+        respx.get("https://api.justifi.ai/v1/test").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "4"}, json={}),
+                Response(200, json={"data": "success"}),
+            ]
+        )
+
+        with patch("python.core.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            result = await mock_client.request("GET", "/v1/test", retries=1)
+
+        assert result == {"data": "success"}
+        wait_time = sleep.await_args.args[0]
+        assert 2.0 <= wait_time <= 6.0
+
+
+class TestRetryWaitTime:
+    """Test jittered backoff calculation."""
+
+    async def test_exponential_base_with_jitter(self):
+        """Test backoff stays within the jitter band around 2**attempt."""
+        from python.core import _retry_wait_time
+
+        for attempt in range(4):
+            wait_time = _retry_wait_time(attempt)
+            assert 0.5 * 2**attempt <= wait_time <= 1.5 * 2**attempt
+
+    async def test_non_numeric_retry_after_falls_back(self):
+        """Test HTTP-date Retry-After values fall back to exponential backoff."""
+        from python.core import _retry_wait_time
+
+        wait_time = _retry_wait_time(1, "Wed, 21 Oct 2015 07:28:00 GMT")
+        assert 1.0 <= wait_time <= 3.0
+
+    async def test_wait_time_capped(self):
+        """Test backoff never exceeds the maximum retry wait."""
+        from python.core import MAX_RETRY_WAIT, _retry_wait_time
+
+        assert _retry_wait_time(10) <= MAX_RETRY_WAIT
+        assert _retry_wait_time(0, "600") <= MAX_RETRY_WAIT
+
 
 class TestClientErrorHandling:
     """Test specific error handling without retry delays."""
@@ -299,6 +393,22 @@ class TestHandleToolErrorsDecorator:
         assert str(exc_info.value) == "Generic error"
         assert exc_info.value.error_type == "ValueError"
 
+    async def test_decorator_preserves_tool_errors(self):
+        """Test that @handle_tool_errors re-raises ToolErrors unchanged."""
+        from python.tools.base import ToolError, handle_tool_errors
+
+        original = ToolError("Generation failed", error_type="CodeGenerationError")
+
+        @handle_tool_errors
+        async def mock_tool_function():
+            raise original
+
+        with pytest.raises(ToolError) as exc_info:
+            await mock_tool_function()
+
+        assert exc_info.value is original
+        assert exc_info.value.error_type == "CodeGenerationError"
+
     async def test_decorator_allows_success(self):
         """Test that @handle_tool_errors allows successful execution."""
         from unittest.mock import AsyncMock
@@ -0,0 +1,69 @@
+"""Tests for JustiFi code generation tools."""
+
+import pytest
+
+from python.core import JustiFiClient
+from python.tools.code_generators import generate_unified_checkout_integration
+from python.tools.response_wrapper import wrap_tool_call
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock JustiFi client for testing."""
+    return JustiFiClient(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+class TestGenerateUnifiedCheckoutIntegration:
+    """Tests for generate_unified_checkout_integration."""
+
+    @pytest.mark.asyncio
+    async def test_returns_complete_integration(self, mock_client):
+        """Test the response contains every generated file."""
+        result = await generate_unified_checkout_integration(mock_client)
+
+        assert result["metadata"]["tool"] == "generate_unified_checkout_integration"
+        integration = result["data"][0]
+        assert integration["success"] is True
+        assert set(integration["files"]) == {
+            "server.js",
+            "package.json",
+            "public/index.html",
+            ".env.example",
+            "justifi-integration-guide.yaml",
+            "README.md",
+            "tests/checkout.test.js",
+        }
+        assert all(integration["files"].values())
+
+    @pytest.mark.asyncio
+    async def test_mutating_response_does_not_affect_later_calls(self, mock_client):
+        """Test each call gets its own copy of the cached response."""
+        first = await generate_unified_checkout_integration(mock_client)
+        first["metadata"]["tool"] = "mutated"
+        first["data"][0]["files"].clear()
+        first["data"][0]["resources"]["documentation"].clear()
+        first["data"][0]["next_steps"].clear()
+
+        second = await generate_unified_checkout_integration(mock_client)
+
+        assert second["metadata"]["tool"] == "generate_unified_checkout_integration"
+        assert second["data"][0]["files"]
+        assert second["data"][0]["resources"]["documentation"]
+        assert second["data"][0]["next_steps"]
+        assert isinstance(second["data"][0]["next_steps"], list)
+
+    @pytest.mark.asyncio
+    async def test_wrap_tool_call_keeps_standardized_response(self, mock_client):
+        """Test the MCP wrapper does not rebuild the pre-standardized response."""
+        direct = await generate_unified_checkout_integration(mock_client)
+        wrapped = await wrap_tool_call(
+            "generate_unified_checkout_integration",
+            generate_unified_checkout_integration,
+            mock_client,
+        )
+
+        assert wrapped == direct
+        assert wrapped["metadata"]["original_format"] == "unknown"
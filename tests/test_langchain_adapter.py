@@ -0,0 +1,35 @@
+"""Tests for the LangChain adapter's result serialization."""
+
+import json
+from decimal import Decimal
+
+from python.adapters.langchain import _dump_result
+
+
+class TestDumpResult:
+    """Tests for _dump_result."""
+
+    def test_indented_json(self):
+        """Test results are pretty-printed with two-space indentation."""
+        assert _dump_result({"data": {"id": "po_123"}}) == json.dumps(
+            {"data": {"id": "po_123"}}, indent=2
+        )
+
+    def test_non_ascii_not_escaped(self):
+        """Test non-ASCII text is kept as UTF-8 instead of \\u escapes."""
+        output = _dump_result({"description": "Café – 5€"})
+
+        assert "Café – 5€" in output
+        assert json.loads(output) == {"description": "Café – 5€"}
+
+    def test_non_finite_floats_become_null(self):
+        """Test NaN and Infinity serialize as null, keeping the JSON valid."""
+        output = _dump_result({"nan": float("nan"), "inf": float("inf")})
+
+        assert json.loads(output) == {"nan": None, "inf": None}
+
+    def test_unsupported_types_fall_back_to_str(self):
+        """Test values orjson can't encode are converted with str()."""
+        output = _dump_result({"amount": Decimal("10.50"), 1: "non-str key"})
+
+        assert json.loads(output) == {"amount": "10.50", "1": "non-str key"}
@@ -1,10 +1,11 @@
 """Test main MCP server functionality."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
-from modelcontextprotocol.main import health_check
+from modelcontextprotocol.main import health_check, install_event_loop_policy
 from python.config import JustiFiConfig
 
 # Only async tests are marked individually
@@ -39,3 +40,12 @@ class TestMainCriticalErrors:
 
             assert result["status"] == "unhealthy"
             assert "error" in result
+
+    def test_event_loop_policy_unchanged_without_uvloop(self):
+        """Test the default asyncio policy is kept when uvloop is unavailable."""
+        policy = asyncio.get_event_loop_policy()
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert install_event_loop_policy() is False
+
+        assert asyncio.get_event_loop_policy() is policy
@@ -7,6 +7,7 @@ from httpx import Response
 from python.core import JustiFiClient
 from python.tools.base import ToolError, ValidationError
 from python.tools.payouts import (
+    get_payout_status,
     get_recent_payouts,
     list_payouts,
     retrieve_payout,
@@ -89,6 +90,30 @@ class TestListPayouts:
 class TestGetPayoutStatus:
     """Test get_payout_status function."""
 
+    @respx.mock
+    async def test_get_payout_status_polling_is_not_cached(
+        self, justifi_client, mock_token_response
+    ):
+        """Test polling status twice returns the live state each time."""
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+        payout_route = respx.get("https://api.justifi.ai/v1/payouts/po_123").mock(
+            side_effect=[
+                Response(200, json={"data": {"id": "po_123", "status": "in_transit"}}),
+                Response(200, json={"data": {"id": "po_123", "status": "paid"}}),
+            ]
+        )
+
+        assert await get_payout_status(justifi_client, "po_123") == "in_transit"
+        assert await get_payout_status(justifi_client, "po_123") == "paid"
+        assert payout_route.call_count == 2
+
+    async def test_get_payout_status_empty_id(self, justifi_client):
+        """Test error handling for empty payout ID."""
+        with pytest.raises(ValidationError, match="payout_id cannot be empty"):
+            await get_payout_status(justifi_client, "")
+
 
 class TestGetRecentPayouts:
     """Test get_recent_payouts function."""
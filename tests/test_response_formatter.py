@@ -99,6 +99,27 @@ class TestStandardizeResponse:
         assert result["metadata"]["original_format"] == "unknown"
         assert "warning" in result["metadata"]
 
+    def test_standardize_already_standardized_response(self):
+        """Test that re-standardizing for the same tool returns the input as-is."""
+        standardized = standardize_response(
+            {"data": {"id": "po_123"}}, "retrieve_payout"
+        )
+
+        result = standardize_response(standardized, "retrieve_payout")
+
+        assert result is standardized
+        assert result["metadata"]["is_single_item"] is True
+
+    def test_standardize_response_from_other_tool_is_rewrapped(self):
+        """Test that a standardized response is rebuilt for a different tool."""
+        standardized = standardize_response({"data": []}, "list_payouts")
+
+        result = standardize_response(standardized, "list_payments")
+
+        assert result is not standardized
+        assert result["metadata"]["tool"] == "list_payments"
+        assert result["metadata"]["type"] == "payments"
+
     def test_data_type_extraction(self):
         """Test that data types are correctly extracted from tool names."""
         test_cases = [
@@ -319,6 +319,35 @@ class TestGetTerminalStatus:
         assert result["data"][0]["id"] == "trm_test123"
         assert result["data"][0]["status"] == "CONNECTED"
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_terminal_status_polling_is_not_cached(
+        self, justifi_client, mock_token_response
+    ):
+        """Test polling status twice returns the live state each time."""
+        respx.post("https://api.justifi.ai/oauth/token").mock(
+            return_value=Response(200, json=mock_token_response)
+        )
+        status_route = respx.get(
+            "https://api.justifi.ai/v1/terminals/trm_test123/status"
+        ).mock(
+            side_effect=[
+                Response(
+                    200, json={"data": {"id": "trm_test123", "status": "DISCONNECTED"}}
+                ),
+                Response(
+                    200, json={"data": {"id": "trm_test123", "status": "CONNECTED"}}
+                ),
+            ]
+        )
+
+        first = await get_terminal_status(justifi_client, "trm_test123")
+        second = await get_terminal_status(justifi_client, "trm_test123")
+
+        assert first["data"][0]["status"] == "DISCONNECTED"
+        assert second["data"][0]["status"] == "CONNECTED"
+        assert status_route.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_terminal_status_invalid_id(self, justifi_client):
         """Test terminal status retrieval with invalid ID."""
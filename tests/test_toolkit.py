@@ -149,3 +149,24 @@ class TestJustiFiToolkitAutoDiscovery:
         toolkit_available = set(toolkit_summary["available_tools"])
 
         assert config_tools == toolkit_available
+
+    def test_enabled_tools_refresh_when_config_replaced(
+        self, basic_config, restricted_config
+    ):
+        """Test that reassigning config invalidates the cached enabled tools."""
+        toolkit = JustiFiToolkit(config=basic_config)
+        assert len(toolkit.get_enabled_tools()) > 2
+
+        toolkit.config = restricted_config
+
+        assert set(toolkit.get_enabled_tools()) == {"retrieve_payout", "list_payouts"}
+        assert toolkit.get_configuration_summary()["total_tools"] == 2
+
+    def test_enabled_tools_refresh_when_config_edited(self, restricted_config):
+        """Test that editing enabled_tools in place is picked up."""
+        toolkit = JustiFiToolkit(config=restricted_config)
+        assert set(toolkit.get_enabled_tools()) == {"retrieve_payout", "list_payouts"}
+
+        toolkit.config.enabled_tools = ["list_payouts"]
+
+        assert set(toolkit.get_enabled_tools()) == {"list_payouts"}